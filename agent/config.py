@@ -1,10 +1,13 @@
 """Configuration for the Code Execution Deep Agent.
 
 All configurables including paths, timeouts, model settings, and backend creation.
+
+Heavy objects (backends, model, skills middleware, subagents) are built lazily by
+cached factory functions, so importing this module has no side effects.
 """
 
+import functools
 import os
-import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -16,25 +19,11 @@ from libs.backends import DockerExecutionBackend
 from libs.middleware import SkillsMiddleware
 from agent.prompt import SYSTEM_PROMPT
 
-# Load environment variables
-load_dotenv()
-
-# Get API key (validation happens when agent is used)
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 WORKSPACE_DIR = PROJECT_ROOT / "workspace"
 SKILLS_DIR = PROJECT_ROOT / "skills"
 
-# Ensure directories exist
-WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
-SKILLS_DIR.mkdir(parents=True, exist_ok=True)
-for subdir in ("data", "scripts", "results", "competitors", "reports"):
-    (WORKSPACE_DIR / subdir).mkdir(parents=True, exist_ok=True)
-# Ensure nested directories for competitive intelligence
-(WORKSPACE_DIR / "reports" / "daily").mkdir(parents=True, exist_ok=True)
-
 # Execution settings
 DEFAULT_TIMEOUT = 120  # seconds
 MAX_OUTPUT_CHARS = 50_000  # characters
@@ -44,42 +33,73 @@ CONTAINER_NAME = "code-execution-agent"  # Docker container name
 MODEL_NAME = "claude-sonnet-4-5-20250929"
 MAX_TOKENS = 8000
 
-# Create backends
-workspace_backend = DockerExecutionBackend(
-    root_dir=WORKSPACE_DIR,
-    container_name=CONTAINER_NAME,
-    default_timeout=DEFAULT_TIMEOUT,
-    max_output_chars=MAX_OUTPUT_CHARS,
-)
-
-skills_backend = FilesystemBackend(
-    root_dir=SKILLS_DIR,
-    virtual_mode=True,
-)
-
-backend = CompositeBackend(
-    default=workspace_backend,
-    routes={
-        "/skills/": skills_backend,
-    },
-)
-
-# Create model
-model = ChatAnthropic(
-    model_name=MODEL_NAME,
-    max_tokens=MAX_TOKENS,
-)
 
-# Discover skills at import time (eager loading for efficiency)
-# This runs synchronously during module import, before any async event loop exists
-_skills_discovery = SkillsMiddleware(skills_dir=SKILLS_DIR)
-DISCOVERED_SKILLS = _skills_discovery.skills
+@functools.cache
+def load_env() -> None:
+    """Load environment variables from .env (API keys are validated on use)."""
+    load_dotenv()
+
+
+@functools.cache
+def get_backend() -> CompositeBackend:
+    """Create the composite backend routing workspace and skills paths.
+
+    Returns:
+        CompositeBackend with the Docker workspace as default and skills
+        mounted at /skills/.
+    """
+    load_env()
+
+    # Ensure directories exist (one directory scan, mkdir only what is missing)
+    WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
+    SKILLS_DIR.mkdir(parents=True, exist_ok=True)
+    with os.scandir(WORKSPACE_DIR) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    for subdir in ("data", "scripts", "results", "competitors", "reports"):
+        if subdir not in existing:
+            (WORKSPACE_DIR / subdir).mkdir(exist_ok=True)
+    # Ensure nested directories for competitive intelligence
+    (WORKSPACE_DIR / "reports" / "daily").mkdir(exist_ok=True)
+
+    workspace_backend = DockerExecutionBackend(
+        root_dir=WORKSPACE_DIR,
+        container_name=CONTAINER_NAME,
+        default_timeout=DEFAULT_TIMEOUT,
+        max_output_chars=MAX_OUTPUT_CHARS,
+    )
+
+    skills_backend = FilesystemBackend(
+        root_dir=SKILLS_DIR,
+        virtual_mode=True,
+    )
+
+    return CompositeBackend(
+        default=workspace_backend,
+        routes={
+            "/skills/": skills_backend,
+        },
+    )
+
+
+@functools.cache
+def get_model() -> ChatAnthropic:
+    """Create the main agent's chat model."""
+    load_env()
+    return ChatAnthropic(
+        model_name=MODEL_NAME,
+        max_tokens=MAX_TOKENS,
+    )
+
+
+@functools.cache
+def get_skills_middleware() -> SkillsMiddleware:
+    """Create the skills middleware shared by the main agent and all subagents.
+
+    Skills are discovered once, synchronously, the first time this is called
+    (before any async event loop exists).
+    """
+    return SkillsMiddleware(skills_dir=SKILLS_DIR)
 
-# Create middleware with pre-discovered skills
-skills_middleware = SkillsMiddleware(
-    skills_dir=SKILLS_DIR,
-    discovered_skills=DISCOVERED_SKILLS,
-)
 
 # HITL configuration
 INTERRUPT_ON = {
@@ -109,15 +129,24 @@ INTERRUPT_ON = {
 #   - Claude model name: "claude-sonnet-4-5-20250929" (uses ChatAnthropic)
 SUBAGENT_MODEL = "gpt-5-mini"
 
-competitive_research_subagent = {
-    "name": "competitor-researcher",
-    "description": (
-        "Research a single competitor by gathering recent news, announcements, "
-        "blog posts, and documentation updates. Use this subagent when you need "
-        "to investigate what a specific competitor has been doing recently."
-    ),
-    "model": SUBAGENT_MODEL,
-    "system_prompt": """You are a competitive intelligence researcher focused on ONE competitor.
+
+@functools.cache
+def get_subagents() -> list[dict]:
+    """Create the subagent specs passed to create_deep_agent.
+
+    Returns:
+        List containing the competitor-researcher subagent spec.
+    """
+    load_env()
+    competitive_research_subagent = {
+        "name": "competitor-researcher",
+        "description": (
+            "Research a single competitor by gathering recent news, announcements, "
+            "blog posts, and documentation updates. Use this subagent when you need "
+            "to investigate what a specific competitor has been doing recently."
+        ),
+        "model": SUBAGENT_MODEL,
+        "system_prompt": """You are a competitive intelligence researcher focused on ONE competitor.
 
 **Mission**: Gather comprehensive intelligence using web search skills (news, blogs, docs), then return a concise executive summary.
 
@@ -131,6 +160,7 @@ competitive_research_subagent = {
 - `web-search-news` - Recent press releases (7 days)
 - `web-search-blogs` - Technical articles (30 days)  
 - `web-search-docs` - Documentation updates (14 days)
+- `web-search-all` - Runs all three searches concurrently (fastest full sweep)
 
 Read skill SKILL.md files for detailed usage instructions when needed.
 
@@ -140,17 +170,14 @@ Read skill SKILL.md files for detailed usage instructions when needed.
 3. Executive summary returned to main agent (3-5 strategic bullets)
 
 Stay focused on your assigned competitor. Delegate research to skills, synthesize strategic insights.""",
-    "tools": [],  # Tools come from middleware (filesystem + execute)
-    "middleware": [
-        # Subagent uses the same SkillsMiddleware as main agent
-        # This gives it access to web-search-news, web-search-blogs, web-search-docs
-        SkillsMiddleware(
-            skills_dir=SKILLS_DIR,
-            discovered_skills=DISCOVERED_SKILLS,  # Reuse discovered skills
-        ),
-        # FilesystemMiddleware is automatically attached by create_deep_agent
-    ],
-}
-
-# Export subagents list for graph.py
-SUBAGENTS = [competitive_research_subagent]
+        "tools": [],  # Tools come from middleware (filesystem + execute)
+        "middleware": [
+            # Subagent shares the main agent's SkillsMiddleware instance
+            # This gives it access to web-search-news, web-search-blogs, web-search-docs,
+            # and web-search-all
+            get_skills_middleware(),
+            # FilesystemMiddleware is automatically attached by create_deep_agent
+        ],
+    }
+
+    return [competitive_research_subagent]
@@ -12,22 +12,20 @@ from langchain_core.messages import HumanMessage
 from deepagents import create_deep_agent
 
 from agent.config import (
-    ANTHROPIC_API_KEY,
     INTERRUPT_ON,
-    SUBAGENTS,
     SYSTEM_PROMPT,
-    backend,
-    model,
-    skills_middleware,
+    get_backend,
+    get_model,
+    get_skills_middleware,
+    get_subagents,
 )
 
 # Create the agent graph with subagents for competitive intelligence
 agent = create_deep_agent(
-    model=model,
+    model=get_model(),
     system_prompt=SYSTEM_PROMPT,
-    backend=backend,
-    middleware=[skills_middleware],
-    subagents=SUBAGENTS,
+    backend=get_backend(),
+    middleware=[get_skills_middleware()],
+    subagents=get_subagents(),
     #interrupt_on=INTERRUPT_ON,
 )
-
@@ -5,7 +5,12 @@ to get secure file I/O operations (on the host) and implements SandboxBackendPro
 to add command execution capabilities inside a Docker container.
 """
 
+import asyncio
 import os
+import re
+import shlex
+from collections import deque
+from collections.abc import Iterable
 from pathlib import Path
 
 import docker
@@ -29,9 +34,20 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
     Attributes:
         container_name: Name of the Docker container to execute commands in.
         default_timeout: Maximum seconds allowed for command execution (default: 120).
-        max_output_chars: Maximum characters in combined output before truncation.
+        max_output_chars: Maximum size of combined output before truncation
+            (counted on the raw output bytes).
     """
 
+    # Characters that need a shell to interpret (pipes, redirects, expansion, ...)
+    _SHELL_META = re.compile(r"[|&;<>$`()\\*?\[\]{}!#~\n]")
+    # Executables known to exist in the container image that behave the same
+    # with or without a shell. Anything else (builtins such as cd/command/type,
+    # keywords such as time, unknown tools) still runs through sh -c.
+    _DIRECT_EXEC = frozenset({
+        "python", "python3", "pip", "pip3", "ls", "cat", "head", "tail",
+        "wc", "grep", "mkdir", "cp", "mv", "rm", "touch",
+    })
+
     def __init__(
         self,
         root_dir: str | Path | None = None,
@@ -54,6 +70,8 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
         self.container_name = container_name
         self.default_timeout = default_timeout
         self.max_output_chars = max_output_chars
+        self._env_cache: list[str] | None = None
+        self._id = f"docker-exec-{container_name}"
 
         # Check Docker availability and get container
         try:
@@ -79,17 +97,19 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
         except Exception as e:
             raise DockerException(f"Failed to connect to Docker: {e}") from e
 
-    def execute(self, command: str) -> ExecuteResponse:
+    def execute(self, command: str, *, timeout: int | None = None) -> ExecuteResponse:
         """Execute a shell command inside the Docker container.
 
         The command runs with:
         - Working directory: /workspace inside container
         - Environment: Inherits from container + parent process env vars
-        - Timeout: Configured default_timeout
+        - Timeout: Enforced inside the container with coreutils `timeout`, which
+          terminates the command (then kills it after a grace period) and exits 124
         - Output capture: Combined stdout and stderr
 
         Args:
             command: Shell command string to execute.
+            timeout: Maximum seconds to run; None uses default_timeout, 0 disables it.
 
         Returns:
             ExecuteResponse with:
@@ -98,33 +118,22 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
                 - truncated: True if output was truncated
         """
         try:
-            # Build environment dict from parent process
-            env = dict(os.environ)
-            
-            # Execute command inside container
-            exec_result = self.container.exec_run(
-                cmd=["sh", "-c", command],
+            # Execute command inside container via the low-level API so output
+            # can be consumed as a stream instead of buffered in full
+            api = self.docker_client.api
+            exec_id = api.exec_create(
+                self.container.id,
+                cmd=self._with_timeout(self._build_argv(command), timeout),
                 workdir="/workspace",
-                environment=env,
-                demux=False,  # Combine stdout/stderr
-                stream=False,
-            )
+                environment=self._build_env(),
+            )["Id"]
+            chunks = api.exec_start(exec_id, stream=True)  # Combined stdout/stderr
 
-            # Get output (bytes) and decode
-            output = exec_result.output.decode("utf-8", errors="replace") if exec_result.output else ""
-            exit_code = exec_result.exit_code
-
-            # Truncate if too long (preserve beginning and end)
-            truncated = len(output) > self.max_output_chars
-            if truncated:
-                half = self.max_output_chars // 2
-                head = output[:half]
-                tail = output[-half:]
-                output = head + "\n... [truncated] ...\n" + tail
+            output, truncated = self._collect_output(chunks)
 
             return ExecuteResponse(
                 output=output,
-                exit_code=exit_code,
+                exit_code=api.exec_inspect(exec_id)["ExitCode"],
                 truncated=truncated,
             )
 
@@ -135,6 +144,154 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
                 truncated=False,
             )
 
+    async def execute_many(self, commands: list[str]) -> list[ExecuteResponse]:
+        """Execute several shell commands concurrently inside the Docker container.
+
+        Each command runs as its own exec in the container, so independent
+        commands (e.g. several skill scripts) complete in roughly the time of the
+        slowest one instead of the sum of all of them.
+
+        Args:
+            commands: Shell command strings to execute.
+
+        Returns:
+            List of ExecuteResponse objects in the same order as commands. A
+            command exceeding default_timeout is stopped inside the container
+            and yields exit_code 124.
+        """
+        return list(
+            await asyncio.gather(*(asyncio.to_thread(self.execute, command) for command in commands))
+        )
+
+    def _with_timeout(self, argv: list[str], timeout: int | None) -> list[str]:
+        """Wrap argv in coreutils `timeout` so the container enforces the limit.
+
+        Args:
+            argv: Argument vector for the Docker exec.
+            timeout: Seconds allowed; None uses default_timeout, 0 disables it.
+
+        Returns:
+            Argument vector that runs argv under `timeout` (unchanged if disabled).
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        if not timeout:
+            return argv
+        # SIGTERM at the limit, SIGKILL 5s later if the command ignores it
+        return ["timeout", "-k", "5", str(timeout), *argv]
+
+    def _build_argv(self, command: str) -> list[str]:
+        """Build the argv used to run a command in the container.
+
+        Simple commands whose program is in _DIRECT_EXEC (e.g.
+        "python3 script.py --flag 'a b'") are split and executed directly,
+        skipping a shell process per call. Everything else runs via "sh -c".
+
+        Args:
+            command: Shell command string to execute.
+
+        Returns:
+            Argument vector for the Docker exec.
+        """
+        if self._SHELL_META.search(command) is None:
+            try:
+                argv = shlex.split(command)
+            except ValueError:
+                argv = []
+            if argv and argv[0] in self._DIRECT_EXEC:
+                return argv
+        return ["sh", "-c", command]
+
+    def _collect_output(self, chunks: Iterable[bytes]) -> tuple[str, bool]:
+        """Read streamed command output, keeping only what fits the output limit.
+
+        The first half of the limit is kept in a head buffer and the most recent
+        bytes in a bounded tail buffer, so memory stays proportional to
+        max_output_chars no matter how much the command prints. Truncation is
+        applied to the raw bytes and only the kept parts are decoded.
+
+        Args:
+            chunks: Combined stdout/stderr byte chunks streamed from the container.
+
+        Returns:
+            Tuple of (decoded output, whether it was truncated).
+        """
+        half = self.max_output_chars // 2
+        tail_limit = self.max_output_chars - half
+        head = bytearray()
+        tail: deque[bytes] = deque()
+        tail_size = 0
+        total = 0
+
+        for chunk in chunks:
+            total += len(chunk)
+            if len(head) < half:
+                room = half - len(head)
+                head += chunk[:room]
+                chunk = chunk[room:]
+                if not chunk:
+                    continue
+            tail.append(chunk)
+            tail_size += len(chunk)
+            # Drop whole chunks that fall outside the tail window
+            while len(tail) > 1 and tail_size - len(tail[0]) >= tail_limit:
+                tail_size -= len(tail.popleft())
+
+        if not total:
+            return "", False
+        if total <= self.max_output_chars:
+            # Short outputs fit entirely in head; skip joining an empty tail
+            if tail:
+                head += b"".join(tail)
+            return head.decode("utf-8", errors="replace"), False
+
+        # Preserve beginning and end. Both cuts are moved onto UTF-8 character
+        # boundaries so a split multi-byte character does not decode as U+FFFD.
+        # The tail is decoded through a memoryview slice so its last
+        # `tail_limit` bytes are not copied before decoding.
+        del head[self._utf8_complete_length(head):]
+        tail_bytes = b"".join(tail)
+        start = max(len(tail_bytes) - tail_limit, 0)
+        # Skip continuation bytes of a character that began before the cut
+        while start < len(tail_bytes) and tail_bytes[start] & 0xC0 == 0x80:
+            start += 1
+        tail_view = memoryview(tail_bytes)[start:]
+        output = (
+            head.decode("utf-8", errors="replace")
+            + "\n... [truncated] ...\n"
+            + str(tail_view, "utf-8", "replace")
+        )
+        return output, True
+
+    @staticmethod
+    def _utf8_complete_length(data: bytes | bytearray) -> int:
+        """Return the length of data without a trailing incomplete UTF-8 character."""
+        # A character is at most 4 bytes: look back for its lead byte
+        for back in range(1, min(4, len(data)) + 1):
+            byte = data[-back]
+            if byte & 0xC0 == 0x80:
+                continue  # Continuation byte
+            if byte >= 0xC0:
+                width = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+                if back < width:
+                    return len(data) - back
+            break
+        return len(data)
+
+    def _build_env(self) -> list[str]:
+        """Return the environment passed to commands, built once per backend.
+
+        The parent process environment is snapshotted on first use and kept in
+        the "KEY=value" list form the Docker exec API expects, so neither the
+        copy nor the per-exec formatting is repeated on every execute() call.
+
+        Returns:
+            List of "KEY=value" strings from the parent process environment.
+        """
+        if self._env_cache is None:
+            self._env_cache = [f"{key}={value}" for key, value in os.environ.items()]
+        return self._env_cache
+
     @property
     def id(self) -> str:
         """Return a stable identifier for this backend instance.
@@ -142,5 +299,5 @@ class DockerExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
         Returns:
             String identifier in format "docker-exec-<container_name>".
         """
-        return f"docker-exec-{self.container_name}"
+        return self._id
 
@@ -8,6 +8,7 @@ Skills are discovered at initialization time (typically at import/startup),
 not during agent execution, for better performance and simpler async handling.
 """
 
+import os
 import re
 from collections.abc import Awaitable, Callable
 from pathlib import Path
@@ -19,6 +20,11 @@ from langchain.agents.middleware.types import (
     ModelResponse,
 )
 
+# Discovery results per resolved skills directory: (fingerprint, skills).
+# The fingerprint stats every <skill>/SKILL.md, so adding, removing, or
+# editing a skill forces a rescan.
+_DISCOVERY_CACHE: dict[str, tuple[tuple, list[dict]]] = {}
+
 
 class SkillsMiddleware(AgentMiddleware):
     """Middleware that implements progressive disclosure for agent skills.
@@ -48,6 +54,9 @@ class SkillsMiddleware(AgentMiddleware):
         else:
             self.skills = self._discover_skills()
 
+        # Skills are fixed after init, so format the prompt section once
+        self.skills_prompt = self._format_skills_prompt(self.skills)
+
 
     def wrap_model_call(
         self,
@@ -63,16 +72,14 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             Model response from handler.
         """
-        if self.skills:
-            skills_prompt = self._format_skills_prompt(self.skills)
-            
+        if self.skills_prompt:
             # Append to existing system prompt
             if request.system_prompt:
                 request = request.override(
-                    system_prompt=request.system_prompt + "\n\n" + skills_prompt
+                    system_prompt=request.system_prompt + "\n\n" + self.skills_prompt
                 )
             else:
-                request = request.override(system_prompt=skills_prompt)
+                request = request.override(system_prompt=self.skills_prompt)
 
         return handler(request)
 
@@ -82,21 +89,23 @@ class SkillsMiddleware(AgentMiddleware):
         handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
     ) -> ModelResponse:
         """Async version of wrap_model_call."""
-        if self.skills:
-            skills_prompt = self._format_skills_prompt(self.skills)
-            
+        if self.skills_prompt:
             if request.system_prompt:
                 request = request.override(
-                    system_prompt=request.system_prompt + "\n\n" + skills_prompt
+                    system_prompt=request.system_prompt + "\n\n" + self.skills_prompt
                 )
             else:
-                request = request.override(system_prompt=skills_prompt)
+                request = request.override(system_prompt=self.skills_prompt)
 
         return await handler(request)
 
     def _discover_skills(self) -> list[dict]:
         """Scan skills directory for SKILL.md files and parse metadata.
 
+        Results are cached per directory and reused while no SKILL.md has been
+        added, removed, or modified, so repeated middleware construction skips
+        reading and parsing the files.
+
         Returns:
             List of skill metadata dicts with keys:
             - name: Skill name from frontmatter
@@ -109,6 +118,13 @@ class SkillsMiddleware(AgentMiddleware):
         if not self.skills_dir.exists():
             return skills
 
+        cache_key = str(self.skills_dir.resolve())
+        fingerprint = self._skills_fingerprint()
+        cached = _DISCOVERY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            # Copy so callers can't mutate the cached metadata
+            return [dict(skill) for skill in cached[1]]
+
         # Scan for subdirectories containing SKILL.md
         for skill_dir in self.skills_dir.iterdir():
             if not skill_dir.is_dir():
@@ -120,8 +136,9 @@ class SkillsMiddleware(AgentMiddleware):
 
             try:
                 metadata = self._parse_skill_frontmatter(skill_md)
-                metadata["skill_root"] = str(skill_dir.resolve())
-                metadata["skill_md_path"] = str(skill_md.resolve())
+                skill_root = skill_dir.resolve()
+                metadata["skill_root"] = str(skill_root)
+                metadata["skill_md_path"] = str(skill_root / "SKILL.md")
                 metadata["virtual_skill_md_path"] = f"/skills/{skill_dir.name}/SKILL.md"
                 skills.append(metadata)
             except (ValueError, KeyError) as e:
@@ -129,8 +146,27 @@ class SkillsMiddleware(AgentMiddleware):
                 print(f"Warning: Skipping invalid skill {skill_dir.name}: {e}")
                 continue
 
+        _DISCOVERY_CACHE[cache_key] = (fingerprint, [dict(skill) for skill in skills])
         return skills
 
+    def _skills_fingerprint(self) -> tuple:
+        """Stat each skill's SKILL.md without reading it.
+
+        Returns:
+            Sorted tuple of (skill directory name, SKILL.md mtime_ns, size).
+        """
+        entries = []
+        with os.scandir(self.skills_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                try:
+                    stat = os.stat(os.path.join(entry.path, "SKILL.md"))
+                except OSError:
+                    continue
+                entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
     def _parse_skill_frontmatter(self, skill_md_path: Path) -> dict:
         """Parse YAML frontmatter from a SKILL.md file.
 
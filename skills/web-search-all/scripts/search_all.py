@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Run the news, blogs, and docs searches for a company concurrently.
+
+The three web-search skills each make one independent Tavily request. Running
+them as separate scripts costs the sum of three round-trips; this script fires
+all three at once with the async Tavily client, so a full sweep takes roughly
+as long as the slowest search.
+
+Query construction, domain whitelists, and result normalization are reused
+from the individual skill scripts, so results are identical to running them
+one by one.
+
+Contract:
+- Input: Company name + optional per-search time windows + max results
+- Output: news.json, blogs.json, docs.json in --output-dir, summary JSON on stdout
+- Errors: Clear messages to stderr + non-zero exit code if every search fails
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Sibling skill scripts providing build_search_params/normalize_results/...
+SKILLS_ROOT = Path(__file__).resolve().parents[2]
+SEARCH_SCRIPTS = {
+    "news": SKILLS_ROOT / "web-search-news" / "scripts" / "search_news.py",
+    "blogs": SKILLS_ROOT / "web-search-blogs" / "scripts" / "search_blogs.py",
+    "docs": SKILLS_ROOT / "web-search-docs" / "scripts" / "search_docs.py",
+}
+
+# JSON output and cache helpers shared by the web-search skills
+sys.path.insert(0, str(SKILLS_ROOT / "web-search-common"))
+from search_common import (  # noqa: E402
+    aclose_client,
+    build_output,
+    build_summary,
+    dumps_json,
+    load_cached_response,
+    print_json,
+    store_cached_response,
+)
+
+
+def http2_enabled() -> bool:
+    """Whether to multiplex searches over one HTTP/2 connection.
+
+    Opt-in via TAVILY_HTTP2=1; requires the h2 package (pip install 'httpx[http2]').
+    """
+    if os.getenv("TAVILY_HTTP2") != "1":
+        return False
+    if importlib.util.find_spec("h2") is None:
+        print(
+            "Warning: TAVILY_HTTP2=1 but h2 is not installed; using HTTP/1.1. "
+            "Run: pip install 'httpx[http2]'",
+            file=sys.stderr,
+        )
+        return False
+    return True
+
+
+def load_search_module(kind: str, path: Path):
+    """Import a sibling search script as a module."""
+    spec = importlib.util.spec_from_file_location(f"search_{kind}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_client(api_key: str, http=None):
+    """Create the async Tavily client, on the shared http transport if given.
+
+    Exits with an error if the client cannot be initialized.
+    """
+    from tavily import AsyncTavilyClient
+
+    try:
+        if http is not None:
+            try:
+                return AsyncTavilyClient(api_key=api_key, client=http)
+            except TypeError:
+                # tavily-python releases before the client argument (e.g. 0.7.12)
+                print(
+                    "Warning: installed tavily-python does not accept a custom HTTP "
+                    "client; using its default transport. Upgrade tavily-python "
+                    "for HTTP/2.",
+                    file=sys.stderr,
+                )
+        return AsyncTavilyClient(api_key=api_key)
+    except Exception as e:
+        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+async def gather_searches(client, params_by_kind: dict[str, dict]) -> dict:
+    """Run every search on one client, keeping exceptions per kind.
+
+    The client is closed afterwards.
+    """
+    try:
+        responses = await asyncio.gather(
+            *(client.search(**params) for params in params_by_kind.values()),
+            return_exceptions=True,
+        )
+    finally:
+        await aclose_client(client)
+    return dict(zip(params_by_kind, responses))
+
+
+async def run_searches(api_key: str, params_by_kind: dict[str, dict]) -> dict:
+    """Execute all searches concurrently.
+
+    Args:
+        api_key: Tavily API key.
+        params_by_kind: Search parameters keyed by search kind.
+
+    Returns:
+        Dict mapping each kind to its Tavily response, or the exception raised.
+    """
+    if not http2_enabled():
+        return await gather_searches(create_client(api_key), params_by_kind)
+
+    import httpx
+
+    # One multiplexed connection instead of a TLS handshake per search
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url="https://api.tavily.com",
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as http:
+        client = create_client(api_key, http)
+        return await gather_searches(client, params_by_kind)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Search company news, blogs, and docs concurrently using Tavily"
+    )
+    parser.add_argument(
+        "company",
+        help="Company name to search (e.g., 'Anthropic', 'LlamaIndex')",
+    )
+    parser.add_argument(
+        "--news-days",
+        type=int,
+        default=7,
+        help="Days to look back for news (default: 7)",
+    )
+    parser.add_argument(
+        "--blogs-days",
+        type=int,
+        default=30,
+        help="Days to look back for blogs (default: 30)",
+    )
+    parser.add_argument(
+        "--docs-days",
+        type=int,
+        default=14,
+        help="Days to look back for docs (default: 14)",
+    )
+    parser.add_argument(
+        "--max-results",
+        type=int,
+        default=10,
+        help="Maximum number of results per search (default: 10)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        required=True,
+        help="Directory to save news.json, blogs.json, and docs.json",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Tavily instead of reusing recent identical searches",
+    )
+    return parser
+
+
+# Built once at import so in-process callers reuse it
+_PARSER = _build_parser()
+
+
+def main(argv: list[str] | None = None):
+    """Parse CLI arguments and execute all Tavily searches concurrently."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Validate API key before any other setup (fail fast; --help still works)
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key and not {"-h", "--help"} & set(argv):
+        print(
+            "Error: TAVILY_API_KEY environment variable not set.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    args = _PARSER.parse_args(argv)
+
+    modules = {kind: load_search_module(kind, path) for kind, path in SEARCH_SCRIPTS.items()}
+    days_by_kind = {
+        "news": args.news_days,
+        "blogs": args.blogs_days,
+        "docs": args.docs_days,
+    }
+    params_by_kind = {
+        kind: module.build_search_params(args.company, days_by_kind[kind], args.max_results)
+        for kind, module in modules.items()
+    }
+
+    # Reuse identical recent searches if cached; only query Tavily for misses
+    responses = {}
+    queried_at_by_kind = {}
+    if not args.no_cache:
+        for kind, params in params_by_kind.items():
+            cached = load_cached_response(params, ttl=days_by_kind[kind] * 3600)
+            if cached is not None:
+                responses[kind] = cached["response"]
+                queried_at_by_kind[kind] = cached["queried_at"]
+    cached_kinds = set(responses)
+    misses = {kind: params for kind, params in params_by_kind.items() if kind not in responses}
+    if misses:
+        # Imported lazily: fully cached sweeps never need tavily
+        try:
+            import tavily  # noqa: F401
+        except ImportError:
+            print(
+                "Error: tavily-python not installed. Run: pip install tavily-python",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        # One timestamp for every search in this sweep
+        queried_at = datetime.now(timezone.utc).isoformat()
+        for kind, response in asyncio.run(run_searches(api_key, misses)).items():
+            if not isinstance(response, Exception):
+                store_cached_response(params_by_kind[kind], response, queried_at)
+            responses[kind] = response
+            queried_at_by_kind[kind] = queried_at
+
+    # Ensure output directory exists
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    searches = []
+    errors = {}
+    for kind in params_by_kind:
+        response = responses[kind]
+        if isinstance(response, Exception):
+            print(f"Error: Tavily {kind} search failed: {response}", file=sys.stderr)
+            errors[kind] = str(response)
+            continue
+
+        module = modules[kind]
+        results = module.normalize_results(response)
+        output_data = build_output(
+            module.SEARCH_TYPE,
+            args.company,
+            days_by_kind[kind],
+            results,
+            queried_at=queried_at_by_kind[kind],
+            cached=kind in cached_kinds,
+        )
+        output_path = output_dir / f"{kind}.json"
+        try:
+            output_path.write_bytes(dumps_json(output_data, indent=False))
+        except Exception as e:
+            print(f"Error: Failed to write {output_path}: {e}", file=sys.stderr)
+            errors[kind] = str(e)
+            continue
+        searches.append(build_summary(output_data, output_path))
+
+    # Print concise summary to stdout (token-efficient for agents)
+    summary = {
+        "company": args.company,
+        "output_dir": str(output_dir),
+        "searches": searches,
+        "errors": errors,
+    }
+    print_json(summary)
+
+    if not searches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,24 +7,81 @@ frequently than news.
 """
 
 import argparse
-import json
-import os
+import functools
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    from tavily import TavilyClient
-except ImportError:
-    print(
-        "Error: tavily-python not installed. Run: pip install tavily-python",
-        file=sys.stderr,
+# Search flow, JSON output, and cache helpers shared by the web-search skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web-search-common"))
+from search_common import require_api_key, run_search  # noqa: E402
+
+SEARCH_TYPE = "blogs"
+
+# Technical blogging platforms included in every blog search
+BLOG_PLATFORMS = ("medium.com", "dev.to", "substack.com")
+
+
+@functools.lru_cache(maxsize=128)
+def include_domains_for(company_slug: str) -> tuple[str, ...]:
+    """Return the domain whitelist for a company, built once per slug."""
+    return (
+        # Company blog subdomains (common patterns)
+        f"blog.{company_slug}.com", f"blog.{company_slug}.ai",
+        f"engineering.{company_slug}.com", f"{company_slug}.com/blog",
+        *BLOG_PLATFORMS,
+        # General company domains (fallback)
+        f"{company_slug}.com", f"{company_slug}.ai",
     )
-    sys.exit(1)
 
 
-def main():
-    """Parse CLI arguments and execute Tavily search."""
+def build_search_params(company: str, days: int, max_results: int) -> dict:
+    """Build Tavily search parameters for blog posts and articles about a company.
+
+    Args:
+        company: Company name to search for.
+        days: Number of days to look back.
+        max_results: Maximum number of results to return.
+
+    Returns:
+        Keyword arguments for TavilyClient.search().
+    """
+    # Blog-focused query
+    # Why: Targets engineering blogs, technical articles, company blog domains
+    # More specific than generic "blog" search
+    query = f"{company} engineering blog technical deep dive architecture"
+
+    # Domain whitelist for engineering/technical blogs
+    # Company blog subdomains + technical blogging platforms
+    include_domains = include_domains_for(company.lower().replace(' ', ''))
+
+    # Use "general" topic for blogs (more comprehensive than "news")
+    # Include domains filters to target actual blog properties
+    return {
+        "query": query,
+        "search_depth": "advanced",
+        "topic": "general",  # Better for blog content
+        "days": days,
+        "max_results": max_results,
+        "include_domains": include_domains,
+    }
+
+
+def normalize_results(response: dict) -> list[dict]:
+    """Normalize a Tavily response into our standard result format."""
+    return [
+        {
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            "published_at": item.get("published_date"),
+            "content": item.get("content", ""),
+            "score": item.get("score", 0.0),
+        }
+        for item in response.get("results", ())
+    ]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Search for company blog posts and articles using Tavily"
     )
@@ -48,101 +105,31 @@ def main():
         "--output",
         help="Optional: Path to save JSON output file",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Tavily instead of reusing a recent identical search",
+    )
+    parser.add_argument(
+        "--append-jsonl",
+        help="Optional: Append results as one JSON line to this file (for multi-company sweeps)",
+    )
+    return parser
 
-    args = parser.parse_args()
-
-    # Validate API key
-    api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
-        print(
-            "Error: TAVILY_API_KEY environment variable not set.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    # Initialize client
-    try:
-        client = TavilyClient(api_key=api_key)
-    except Exception as e:
-        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Blog-focused query
-    # Why: Targets engineering blogs, technical articles, company blog domains
-    # More specific than generic "blog" search
-    query = f"{args.company} engineering blog technical deep dive architecture"
+# Built once at import so in-process callers reuse it
+_PARSER = _build_parser()
 
-    # Domain whitelist for engineering/technical blogs
-    # Company blog subdomains + technical blogging platforms
-    company_slug = args.company.lower().replace(' ', '')
-    include_domains = [
-        # Company blog subdomains (common patterns)
-        f"blog.{company_slug}.com", f"blog.{company_slug}.ai",
-        f"engineering.{company_slug}.com", f"{company_slug}.com/blog",
-        # Technical blogging platforms
-        "medium.com", "dev.to", "substack.com",
-        # General company domains (fallback)
-        f"{company_slug}.com", f"{company_slug}.ai",
-    ]
 
-    # Execute search
-    try:
-        # Use "general" topic for blogs (more comprehensive than "news")
-        # Include domains filters to target actual blog properties
-        response = client.search(
-            query=query,
-            search_depth="advanced",
-            topic="general",  # Better for blog content
-            days=args.days,
-            max_results=args.max_results,
-            include_domains=include_domains,
-        )
-    except Exception as e:
-        print(f"Error: Tavily search failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Normalize response
-    results = []
-    for item in response.get("results", []):
-        results.append({
-            "title": item.get("title", ""),
-            "url": item.get("url", ""),
-            "published_at": item.get("published_date"),
-            "content": item.get("content", ""),
-            "score": item.get("score", 0.0),
-        })
-
-    # Build output
-    output_data = {
-        "company": args.company,
-        "search_type": "blogs",
-        "queried_at": datetime.now(timezone.utc).isoformat(),
-        "lookback_days": args.days,
-        "results": results,
-        "total_results": len(results),
-    }
+def main(argv: list[str] | None = None):
+    """Parse CLI arguments and execute Tavily search."""
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # Write to file
-    if args.output:
-        try:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            
-            # Print concise summary to stdout (token-efficient for agents)
-            summary = {
-                "saved_to": str(output_path),
-                "company": args.company,
-                "search_type": "blogs",
-                "total_results": len(results),
-                "top_result": results[0]["title"] if results else None,
-                "lookback_days": args.days,
-            }
-            print(json.dumps(summary, indent=2))
-        except Exception as e:
-            print(f"Error: Failed to write output file: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Validate API key before any other setup (fail fast; --help still works)
+    api_key = require_api_key(argv)
+    args = _PARSER.parse_args(argv)
+    run_search(args, api_key, SEARCH_TYPE, build_search_params, normalize_results)
 
 
 if __name__ == "__main__":
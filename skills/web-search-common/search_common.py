@@ -0,0 +1,247 @@
+"""Helpers shared by the web-search skill scripts.
+
+Not a skill itself (no SKILL.md): the news, blogs, docs, all, and extract
+scripts add this directory to sys.path and import from here, so JSON output,
+JSONL appends, the on-disk search cache, and the single-search flow
+(run_search) behave identically everywhere.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+# orjson is optional: faster serialization, falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: dict, indent: bool = True) -> bytes:
+    """Serialize data as JSON bytes, indented unless indent=False."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def print_json(data: dict) -> None:
+    """Print data as indented JSON to stdout."""
+    # Write bytes directly, skipping the text encoding layer
+    sys.stdout.buffer.write(dumps_json(data) + b"\n")
+
+
+def append_jsonl(path: Path, data: dict) -> None:
+    """Append data as one JSON line, safe against concurrent writers."""
+    # POSIX-only; imported here so the other helpers work on any platform
+    import fcntl
+
+    line = dumps_json(data, indent=False) + b"\n"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unbuffered append: the whole line goes out in one write under the lock
+    with open(path, "ab", buffering=0) as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.write(line)
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+async def aclose_client(client) -> None:
+    """Release an AsyncTavilyClient's connection pool.
+
+    A client built on an external httpx client leaves it open for its owner.
+    Clients without close() (older tavily-python) have nothing to release.
+    """
+    close = getattr(client, "close", None)
+    if close is not None:
+        await close()
+
+
+def cache_path(params: dict) -> Path:
+    """Return the cache file for a set of search parameters."""
+    cache_dir = Path(os.getenv("TAVILY_CACHE_DIR", Path.home() / ".cache" / "tavily-search"))
+    key = hashlib.blake2b(
+        json.dumps(params, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def load_cached_response(params: dict, ttl: float) -> dict | None:
+    """Return a cached search younger than ttl seconds, if any.
+
+    The entry is {"queried_at": ..., "response": ...}, so outputs built from
+    it report when Tavily was actually queried. Entries without queried_at
+    (written by older versions) count as misses.
+    """
+    path = cache_path(params)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            entry = json.loads(path.read_bytes())
+            if isinstance(entry, dict) and {"queried_at", "response"} <= entry.keys():
+                return entry
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def store_cached_response(params: dict, response: dict, queried_at: str) -> None:
+    """Cache a Tavily response with its query time (best effort; failures are ignored)."""
+    path = cache_path(params)
+    entry = {"queried_at": queried_at, "response": response}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps_json(entry, indent=False))
+    except OSError:
+        pass
+
+
+def require_api_key(argv: list[str]) -> str | None:
+    """Return TAVILY_API_KEY, exiting with an error if it is not set.
+
+    Checked before argument parsing (fail fast); --help still works without it.
+    """
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key and not {"-h", "--help"} & set(argv):
+        print(
+            "Error: TAVILY_API_KEY environment variable not set.\n"
+            "Set it in your .env file or export it in your shell.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return api_key
+
+
+def build_output(
+    search_type: str,
+    company: str,
+    days: int,
+    results: list[dict],
+    queried_at: str | None = None,
+    cached: bool = False,
+) -> dict:
+    """Build the output JSON following our contract.
+
+    Pass queried_at to share one timestamp across several outputs, or to
+    report the original query time of a cached response (with cached=True).
+    """
+    if queried_at is None:
+        queried_at = datetime.now(timezone.utc).isoformat()
+    return {
+        "company": company,
+        "search_type": search_type,
+        "queried_at": queried_at,
+        "cached": cached,
+        "lookback_days": days,
+        "results": results,
+        "total_results": len(results),
+    }
+
+
+def build_summary(output_data: dict, saved_to: Path) -> dict:
+    """Build the concise summary printed when results are saved to a file."""
+    results = output_data["results"]
+    return {
+        "saved_to": str(saved_to),
+        "company": output_data["company"],
+        "search_type": output_data["search_type"],
+        "total_results": len(results),
+        "top_result": results[0]["title"] if results else None,
+        "lookback_days": output_data["lookback_days"],
+        "queried_at": output_data["queried_at"],
+        "cached": output_data["cached"],
+    }
+
+
+def run_search(
+    args: argparse.Namespace,
+    api_key: str,
+    search_type: str,
+    build_params: Callable[[str, int, int], dict],
+    normalize: Callable[[dict], list[dict]],
+) -> None:
+    """Run one search from parsed CLI arguments and emit its output.
+
+    Args:
+        args: Parsed arguments (company, days, max_results, output, no_cache,
+            append_jsonl).
+        api_key: Tavily API key.
+        search_type: Value of the output's search_type field.
+        build_params: Builds Tavily search parameters from
+            (company, days, max_results).
+        normalize: Turns a Tavily response into the output result list.
+    """
+    params = build_params(args.company, args.days, args.max_results)
+
+    # Reuse an identical recent search if cached (TTL scales with the window)
+    cached = None if args.no_cache else load_cached_response(params, ttl=args.days * 3600)
+
+    if cached is not None:
+        response, queried_at = cached["response"], cached["queried_at"]
+    else:
+        # Imported here so --help, validation errors, and cache hits skip tavily
+        try:
+            from tavily import TavilyClient
+        except ImportError:
+            print(
+                "Error: tavily-python not installed. Run: pip install tavily-python",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        try:
+            client = TavilyClient(api_key=api_key)
+        except Exception as e:
+            print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        queried_at = datetime.now(timezone.utc).isoformat()
+        try:
+            response = client.search(**params)
+        except Exception as e:
+            print(f"Error: Tavily search failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        store_cached_response(params, response, queried_at)
+
+    output_data = build_output(
+        search_type,
+        args.company,
+        args.days,
+        normalize(response),
+        queried_at=queried_at,
+        cached=cached is not None,
+    )
+
+    # Write to file if requested (ensure parent directories exist)
+    if args.output:
+        output_path = Path(args.output)
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Compact on disk (machine-read); only stdout is pretty-printed
+            output_path.write_bytes(dumps_json(output_data, indent=False))
+        except Exception as e:
+            print(f"Error: Failed to write output file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Accumulate into a shared JSONL corpus once the run has succeeded, so a
+    # sweep file never records a run that exited with an error
+    if args.append_jsonl:
+        try:
+            append_jsonl(Path(args.append_jsonl), output_data)
+        except Exception as e:
+            print(f"Error: Failed to append to {args.append_jsonl}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.output:
+        # Print concise summary to stdout (token-efficient for agents)
+        print_json(build_summary(output_data, output_path))
+    elif args.append_jsonl:
+        print_json(build_summary(output_data, Path(args.append_jsonl)))
+    else:
+        # No output file: return full results on stdout
+        print_json(output_data)
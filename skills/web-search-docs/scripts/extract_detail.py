@@ -16,41 +16,76 @@ Contract:
 """
 
 import argparse
+import asyncio
 import hashlib
-import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlsplit
 
-try:
-    from tavily import TavilyClient
-except ImportError:
-    print(
-        "Error: tavily-python not installed. Run: pip install tavily-python",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+# JSON output helpers shared by the web-search skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web-search-common"))
+from search_common import aclose_client, print_json  # noqa: E402
+
+# Tavily Extract accepts at most this many URLs per request
+MAX_URLS_PER_REQUEST = 20
+# Extract requests in flight at once (stay within Tavily rate limits)
+MAX_CONCURRENT_REQUESTS = 5
 
 
 def url_to_filename(url: str) -> str:
     """Convert URL to safe filename using hash."""
-    # Use first 12 chars of URL hash for uniqueness
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-    # Extract domain for readability
-    domain = url.split('//')[-1].split('/')[0].replace('.', '-')
+    # 6-byte BLAKE2b digest (12 hex chars) for uniqueness
+    url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+    # Extract domain for readability (fall back to first segment for bare URLs)
+    domain = (urlsplit(url).netloc or url.split('/')[0]).replace('.', '-')
     return f"{domain}-{url_hash}.md"
 
 
-def main():
-    """Parse CLI arguments and execute Tavily extract."""
+async def extract_batches(api_key: str, batches: list[list[str]], extract_depth: str) -> list:
+    """Extract URL batches concurrently.
+
+    Args:
+        api_key: Tavily API key.
+        batches: URL lists of at most MAX_URLS_PER_REQUEST each.
+        extract_depth: Tavily extraction depth.
+
+    Returns:
+        One Tavily response per batch, or the exception it raised. Exits
+        with an error if the client cannot be initialized.
+    """
+    from tavily import AsyncTavilyClient
+
+    try:
+        client = AsyncTavilyClient(api_key=api_key)
+    except Exception as e:
+        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
+        sys.exit(1)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def extract(batch: list[str]):
+        async with semaphore:
+            return await client.extract(urls=batch, extract_depth=extract_depth)
+
+    try:
+        return await asyncio.gather(
+            *(extract(batch) for batch in batches), return_exceptions=True
+        )
+    finally:
+        await aclose_client(client)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Extract full content from URLs using Tavily Extract API"
     )
     parser.add_argument(
         "urls",
         nargs="+",
-        help="One or more URLs to extract content from (max 20)",
+        help="One or more URLs to extract content from (batched 20 per request)",
     )
     parser.add_argument(
         "--output-dir",
@@ -63,91 +98,145 @@ def main():
         default="advanced",
         help="Extraction depth (default: advanced for detailed content)",
     )
+    return parser
 
-    args = parser.parse_args()
 
-    # Validate inputs
-    if len(args.urls) > 20:
-        print(
-            f"Error: Tavily Extract API supports max 20 URLs per request, got {len(args.urls)}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
+# Built once at import so in-process callers reuse it
+_PARSER = _build_parser()
+
 
-    # Validate API key
+def main(argv: list[str] | None = None):
+    """Parse CLI arguments and execute Tavily extract."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Validate API key before any other setup (fail fast; --help still works)
     api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
+    if not api_key and not {"-h", "--help"} & set(argv):
         print(
             "Error: TAVILY_API_KEY environment variable not set.",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    # Initialize client
-    try:
-        client = TavilyClient(api_key=api_key)
-    except Exception as e:
-        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
-        sys.exit(1)
+    args = _PARSER.parse_args(argv)
 
-    # Execute extract
+    # Drop repeated URLs (order-preserving) so each page is only billed once
+    urls = list(dict.fromkeys(args.urls))
+
+    # Imported here so --help and validation errors skip the tavily import
     try:
-        response = client.extract(
-            urls=args.urls,
-            extract_depth=args.extract_depth,
+        import tavily  # noqa: F401
+    except ImportError:
+        print(
+            "Error: tavily-python not installed. Run: pip install tavily-python",
+            file=sys.stderr,
         )
-    except Exception as e:
-        print(f"Error: Tavily extract failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Tavily caps URLs per request: split into batches and extract them concurrently
+    batches = [
+        urls[i:i + MAX_URLS_PER_REQUEST] for i in range(0, len(urls), MAX_URLS_PER_REQUEST)
+    ]
+    responses = asyncio.run(extract_batches(api_key, batches, args.extract_depth))
+    results = []
+    failed_batches = 0
+    for batch, response in zip(batches, responses):
+        if isinstance(response, Exception):
+            print(
+                f"Error: Tavily extract failed for {len(batch)} URL(s) "
+                f"starting at {batch[0]}: {response}",
+                file=sys.stderr,
+            )
+            failed_batches += 1
+            continue
+        results.extend(response.get("results", []))
+
+    if failed_batches == len(batches):
         sys.exit(1)
 
     # Ensure output directory exists
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # One timestamp for the whole batch (file headers and output JSON)
+    extracted_at = datetime.now(timezone.utc).isoformat()
+
     # Process results and save to files
+    # Each file is encoded into a single blob (metadata header + content) and
+    # written in one call; writes run concurrently across files.
+    pending = []
+    # Content digest -> URL whose file holds that content
+    kept_by_digest = {}
+    # Skipped URL -> URL kept in its place
+    duplicate_of = {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for result in results:
+            url = result.get("url", "")
+            raw_content = result.get("raw_content", "")
+
+            if not raw_content:
+                print(f"Warning: No content extracted from {url}", file=sys.stderr)
+                continue
+
+            # Collapse pages with identical content (mirrors, redirects, aliases)
+            digest = hashlib.blake2b(raw_content.encode("utf-8"), digest_size=16).digest()
+            if digest in kept_by_digest:
+                duplicate_of[url] = kept_by_digest[digest]
+                continue
+            kept_by_digest[digest] = url
+
+            # Generate filename and save
+            filename = url_to_filename(url)
+            filepath = output_dir / filename
+            size_chars = len(raw_content)
+            blob = (
+                # Add metadata header
+                f"<!-- Extracted from: {url} -->\n"
+                f"<!-- Extracted at: {extracted_at} -->\n"
+                f"<!-- Content length: {size_chars} chars -->\n\n"
+                + raw_content
+            ).encode("utf-8")
+            future = executor.submit(filepath.write_bytes, blob)
+            pending.append((future, url, filepath, filename, size_chars))
+
+    # Collect in submission order so output is deterministic
     extracted_files = []
-    for result in response.get("results", []):
-        url = result.get("url", "")
-        raw_content = result.get("raw_content", "")
-        
-        if not raw_content:
-            print(f"Warning: No content extracted from {url}", file=sys.stderr)
-            continue
-
-        # Generate filename and save
-        filename = url_to_filename(url)
-        filepath = output_dir / filename
-        
+    for future, url, filepath, filename, size_chars in pending:
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Add metadata header
-                f.write(f"<!-- Extracted from: {url} -->\n")
-                f.write(f"<!-- Extracted at: {datetime.now(timezone.utc).isoformat()} -->\n")
-                f.write(f"<!-- Content length: {len(raw_content)} chars -->\n\n")
-                f.write(raw_content)
-            
-            extracted_files.append({
-                "url": url,
-                "filepath": str(filepath),
-                "filename": filename,
-                "size_chars": len(raw_content),
-                "size_kb": round(len(raw_content) / 1024, 2),
-            })
+            future.result()
         except Exception as e:
             print(f"Error: Failed to write {filepath}: {e}", file=sys.stderr)
             continue
 
+        extracted_files.append({
+            "url": url,
+            "filepath": str(filepath),
+            "filename": filename,
+            "size_chars": size_chars,
+            "size_kb": round(size_chars / 1024, 2),
+        })
+
+    # Point each skipped duplicate at the file holding its content
+    filepath_by_url = {f["url"]: f["filepath"] for f in extracted_files}
+    duplicates = {
+        url: {"kept_url": kept_url, "filepath": filepath_by_url[kept_url]}
+        for url, kept_url in duplicate_of.items()
+        if kept_url in filepath_by_url
+    }
+
     # Build output JSON
     output_data = {
-        "extracted_at": datetime.now(timezone.utc).isoformat(),
+        "extracted_at": extracted_at,
         "output_dir": str(output_dir),
         "files": extracted_files,
         "total_files": len(extracted_files),
-        "total_size_kb": sum(f["size_kb"] for f in extracted_files),
+        "total_size_kb": round(sum(f["size_kb"] for f in extracted_files), 2),
+        "duplicates": duplicates,
     }
 
     # Print JSON to stdout for agent consumption
-    print(json.dumps(output_data, indent=2))
+    print_json(output_data)
 
 
 if __name__ == "__main__":
@@ -6,24 +6,86 @@ and release notes. Focuses on technical documentation domains.
 """
 
 import argparse
-import json
-import os
+import functools
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    from tavily import TavilyClient
-except ImportError:
-    print(
-        "Error: tavily-python not installed. Run: pip install tavily-python",
-        file=sys.stderr,
+# Search flow, JSON output, and cache helpers shared by the web-search skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web-search-common"))
+from search_common import require_api_key, run_search  # noqa: E402
+
+SEARCH_TYPE = "documentation"
+
+# Platform docs (for cloud providers) included in every docs search
+PLATFORM_DOCS = (
+    "docs.aws.amazon.com", "cloud.google.com/docs",
+    "learn.microsoft.com", "docs.github.com",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def include_domains_for(company_slug: str) -> tuple[str, ...]:
+    """Return the domain whitelist for a company, built once per slug."""
+    return (
+        # Documentation subdomains (common patterns)
+        f"docs.{company_slug}.com", f"docs.{company_slug}.ai",
+        f"api.{company_slug}.com", f"developer.{company_slug}.com",
+        f"{company_slug}.com/docs", f"{company_slug}.com/api",
+        *PLATFORM_DOCS,
+        # General company domains (fallback)
+        f"{company_slug}.com", f"{company_slug}.ai",
     )
-    sys.exit(1)
 
 
-def main():
-    """Parse CLI arguments and execute Tavily search."""
+def build_search_params(company: str, days: int, max_results: int) -> dict:
+    """Build Tavily search parameters for documentation and API updates from a company.
+
+    Args:
+        company: Company name to search for.
+        days: Number of days to look back.
+        max_results: Maximum number of results to return.
+
+    Returns:
+        Keyword arguments for TavilyClient.search().
+    """
+    # Docs-focused query
+    # Why: Targets documentation sites, API references, changelogs
+    query = f"{company} API documentation changelog release notes updates"
+
+    # Domain whitelist for documentation sites
+    # Docs/API subdomains + developer portals
+    include_domains = include_domains_for(company.lower().replace(' ', ''))
+
+    # General topic for docs (docs sites often don't classify as "news")
+    # Include domains targets docs/api subdomains specifically
+    return {
+        "query": query,
+        "search_depth": "advanced",
+        "topic": "general",
+        "days": days,
+        "max_results": max_results,
+        "include_domains": include_domains,
+    }
+
+
+def normalize_results(response: dict) -> list[dict]:
+    """Normalize a Tavily response into our standard result format."""
+    return [
+        # Optionally filter/boost results from docs domains
+        # (For MVP, we'll trust Tavily's ranking)
+        {
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            "published_at": item.get("published_date"),
+            "content": item.get("content", ""),
+            "score": item.get("score", 0.0),
+        }
+        for item in response.get("results", ())
+    ]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Search for documentation and API updates using Tavily"
     )
@@ -47,104 +109,31 @@ def main():
         "--output",
         help="Optional: Path to save JSON output file",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Tavily instead of reusing a recent identical search",
+    )
+    parser.add_argument(
+        "--append-jsonl",
+        help="Optional: Append results as one JSON line to this file (for multi-company sweeps)",
+    )
+    return parser
 
-    args = parser.parse_args()
-
-    # Validate API key
-    api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
-        print(
-            "Error: TAVILY_API_KEY environment variable not set.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    # Initialize client
-    try:
-        client = TavilyClient(api_key=api_key)
-    except Exception as e:
-        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Docs-focused query
-    # Why: Targets documentation sites, API references, changelogs
-    query = f"{args.company} API documentation changelog release notes updates"
+# Built once at import so in-process callers reuse it
+_PARSER = _build_parser()
 
-    # Domain whitelist for documentation sites
-    # Docs/API subdomains + developer portals
-    company_slug = args.company.lower().replace(' ', '')
-    include_domains = [
-        # Documentation subdomains (common patterns)
-        f"docs.{company_slug}.com", f"docs.{company_slug}.ai",
-        f"api.{company_slug}.com", f"developer.{company_slug}.com",
-        f"{company_slug}.com/docs", f"{company_slug}.com/api",
-        # Platform docs (for cloud providers)
-        "docs.aws.amazon.com", "cloud.google.com/docs",
-        "learn.microsoft.com", "docs.github.com",
-        # General company domains (fallback)
-        f"{company_slug}.com", f"{company_slug}.ai",
-    ]
 
-    # Execute search
-    try:
-        # General topic for docs (docs sites often don't classify as "news")
-        # Include domains targets docs/api subdomains specifically
-        response = client.search(
-            query=query,
-            search_depth="advanced",
-            topic="general",
-            days=args.days,
-            max_results=args.max_results,
-            include_domains=include_domains,
-        )
-    except Exception as e:
-        print(f"Error: Tavily search failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Normalize response
-    results = []
-    for item in response.get("results", []):
-        # Optionally filter/boost results from docs domains
-        # (For MVP, we'll trust Tavily's ranking)
-        results.append({
-            "title": item.get("title", ""),
-            "url": item.get("url", ""),
-            "published_at": item.get("published_date"),
-            "content": item.get("content", ""),
-            "score": item.get("score", 0.0),
-        })
-
-    # Build output
-    output_data = {
-        "company": args.company,
-        "search_type": "documentation",
-        "queried_at": datetime.now(timezone.utc).isoformat(),
-        "lookback_days": args.days,
-        "results": results,
-        "total_results": len(results),
-    }
+def main(argv: list[str] | None = None):
+    """Parse CLI arguments and execute Tavily search."""
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # Write to file
-    if args.output:
-        try:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            
-            # Print concise summary to stdout (token-efficient for agents)
-            summary = {
-                "saved_to": str(output_path),
-                "company": args.company,
-                "search_type": "documentation",
-                "total_results": len(results),
-                "top_result": results[0]["title"] if results else None,
-                "lookback_days": args.days,
-            }
-            print(json.dumps(summary, indent=2))
-        except Exception as e:
-            print(f"Error: Failed to write output file: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Validate API key before any other setup (fail fast; --help still works)
+    api_key = require_api_key(argv)
+    args = _PARSER.parse_args(argv)
+    run_search(args, api_key, SEARCH_TYPE, build_search_params, normalize_results)
 
 
 if __name__ == "__main__":
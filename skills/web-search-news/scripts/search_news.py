@@ -14,24 +14,90 @@ Contract:
 """
 
 import argparse
-import json
-import os
+import functools
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    from tavily import TavilyClient
-except ImportError:
-    print(
-        "Error: tavily-python not installed. Run: pip install tavily-python",
-        file=sys.stderr,
+# Search flow, JSON output, and cache helpers shared by the web-search skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "web-search-common"))
+from search_common import require_api_key, run_search  # noqa: E402
+
+SEARCH_TYPE = "news"
+
+# Tech news outlets included in every news search
+NEWS_OUTLETS = (
+    "techcrunch.com", "theverge.com", "cnbc.com", "axios.com",
+    "bloomberg.com", "reuters.com", "venturebeat.com",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def include_domains_for(company_slug: str) -> tuple[str, ...]:
+    """Return the domain whitelist for a company, built once per slug."""
+    return (
+        *NEWS_OUTLETS,
+        # Company-specific (add dynamically if needed)
+        f"{company_slug}.com", f"{company_slug}.ai",
     )
-    sys.exit(1)
 
 
-def main():
-    """Parse CLI arguments and execute Tavily search."""
+def build_search_params(company: str, days: int, max_results: int) -> dict:
+    """Build Tavily search parameters for news about a company.
+
+    Args:
+        company: Company name to search for.
+        days: Number of days to look back.
+        max_results: Maximum number of results to return.
+
+    Returns:
+        Keyword arguments for TavilyClient.search().
+    """
+    # Construct news-focused search query
+    # Why this pattern: Optimized for breaking news and official announcements
+    # - "press release" and "announces" capture official communications
+    # - "launch" and "partnership" catch major business developments
+    # - Company name ensures relevance
+    query = f"{company} press release announces launch partnership news"
+
+    # Domain whitelist for high-signal news sources
+    # Company domains + major tech news outlets
+    include_domains = include_domains_for(company.lower().replace(' ', ''))
+
+    # Why these parameters:
+    # - topic="news": Prioritizes recent, time-sensitive content
+    # - search_depth="advanced": Higher quality, more relevant results
+    # - days=N: Enforces recency constraint (Tavily filters by publish date)
+    # - include_domains: Whitelist high-signal sources, reduce noise
+    # - max_results: Configurable but capped to avoid overwhelming context
+    return {
+        "query": query,
+        "search_depth": "advanced",  # More thorough, higher quality
+        "topic": "news",  # Focus on recent, newsworthy content
+        "days": days,  # Tavily's native time filtering
+        "max_results": max_results,
+        "include_domains": include_domains,
+    }
+
+
+def normalize_results(response: dict) -> list[dict]:
+    """Normalize a Tavily response into our standard result format."""
+    # Contract: Simplified structure for easy agent parsing
+    return [
+        {
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            # Tavily may or may not include published_at; preserve if available
+            "published_at": item.get("published_date"),
+            "content": item.get("content", ""),
+            # Tavily's relevance score (0-1), useful for ranking
+            "score": item.get("score", 0.0),
+        }
+        for item in response.get("results", ())
+    ]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Search for recent company news/updates using Tavily"
     )
@@ -55,109 +121,31 @@ def main():
         "--output",
         help="Optional: Path to save JSON output file",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Tavily instead of reusing a recent identical search",
+    )
+    parser.add_argument(
+        "--append-jsonl",
+        help="Optional: Append results as one JSON line to this file (for multi-company sweeps)",
+    )
+    return parser
 
-    args = parser.parse_args()
-
-    # Validate API key exists
-    api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
-        print(
-            "Error: TAVILY_API_KEY environment variable not set.\n"
-            "Set it in your .env file or export it in your shell.",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    # Initialize Tavily client
-    try:
-        client = TavilyClient(api_key=api_key)
-    except Exception as e:
-        print(f"Error: Failed to initialize Tavily client: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Construct news-focused search query
-    # Why this pattern: Optimized for breaking news and official announcements
-    # - "press release" and "announces" capture official communications
-    # - "launch" and "partnership" catch major business developments
-    # - Company name ensures relevance
-    query = f"{args.company} press release announces launch partnership news"
+# Built once at import so in-process callers reuse it
+_PARSER = _build_parser()
 
-    # Domain whitelist for high-signal news sources
-    # Company domains + major tech news outlets
-    include_domains = [
-        # Tech news outlets
-        "techcrunch.com", "theverge.com", "cnbc.com", "axios.com",
-        "bloomberg.com", "reuters.com", "venturebeat.com",
-        # Company-specific (add dynamically if needed)
-        f"{args.company.lower().replace(' ', '')}.com",
-        f"{args.company.lower().replace(' ', '')}.ai",
-    ]
 
-    # Execute Tavily search with fixed parameters optimized for CI
-    try:
-        # Why these parameters:
-        # - topic="news": Prioritizes recent, time-sensitive content
-        # - search_depth="advanced": Higher quality, more relevant results
-        # - days=N: Enforces recency constraint (Tavily filters by publish date)
-        # - include_domains: Whitelist high-signal sources, reduce noise
-        # - max_results: Configurable but capped to avoid overwhelming context
-        response = client.search(
-            query=query,
-            search_depth="advanced",  # More thorough, higher quality
-            topic="news",  # Focus on recent, newsworthy content
-            days=args.days,  # Tavily's native time filtering
-            max_results=args.max_results,
-            include_domains=include_domains,
-        )
-    except Exception as e:
-        print(f"Error: Tavily search failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Normalize Tavily response into our standard format
-    # Contract: Simplified structure for easy agent parsing
-    results = []
-    for item in response.get("results", []):
-        results.append({
-            "title": item.get("title", ""),
-            "url": item.get("url", ""),
-            # Tavily may or may not include published_at; preserve if available
-            "published_at": item.get("published_date"),
-            "content": item.get("content", ""),
-            # Tavily's relevance score (0-1), useful for ranking
-            "score": item.get("score", 0.0),
-        })
-
-    # Build output JSON following our contract
-    output_data = {
-        "company": args.company,
-        "search_type": "news",
-        "queried_at": datetime.now(timezone.utc).isoformat(),
-        "lookback_days": args.days,
-        "results": results,
-        "total_results": len(results),
-    }
+def main(argv: list[str] | None = None):
+    """Parse CLI arguments and execute Tavily search."""
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # Write to file if requested (ensure parent directories exist)
-    if args.output:
-        try:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            
-            # Print concise summary to stdout (token-efficient for agents)
-            summary = {
-                "saved_to": str(output_path),
-                "company": args.company,
-                "search_type": "news",
-                "total_results": len(results),
-                "top_result": results[0]["title"] if results else None,
-                "lookback_days": args.days,
-            }
-            print(json.dumps(summary, indent=2))
-        except Exception as e:
-            print(f"Error: Failed to write output file: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Validate API key before any other setup (fail fast; --help still works)
+    api_key = require_api_key(argv)
+    args = _PARSER.parse_args(argv)
+    run_search(args, api_key, SEARCH_TYPE, build_search_params, normalize_results)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""Shared fixtures for the web-search skill script tests.
+
+Tavily is replaced with an in-memory fake module, so no network or API key
+is needed.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SKILLS_ROOT = Path(__file__).resolve().parents[1] / "skills"
+
+
+def load_script(relpath: str):
+    """Import a skill script as a module."""
+    path = SKILLS_ROOT / relpath
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeTavily:
+    """Stand-in for the tavily package that records every API call."""
+
+    def __init__(self):
+        self.calls = []
+        # Number of async clients closed
+        self.closed = 0
+        # Predicates deciding which searches / extract batches raise
+        self.fail_search = lambda params: False
+        self.fail_extract = lambda urls: False
+        # Extracted page content by URL (default: unique per URL)
+        self.contents = {}
+        fake = self
+
+        class TavilyClient:
+            def __init__(self, api_key=None, **kwargs):
+                pass
+
+            def search(self, **params):
+                return fake.search(params)
+
+        class AsyncTavilyClient:
+            def __init__(self, api_key=None, **kwargs):
+                pass
+
+            async def search(self, **params):
+                return fake.search(params)
+
+            async def extract(self, urls, extract_depth="basic"):
+                return fake.extract(urls)
+
+            async def close(self):
+                fake.closed += 1
+
+        self.module = types.ModuleType("tavily")
+        self.module.TavilyClient = TavilyClient
+        self.module.AsyncTavilyClient = AsyncTavilyClient
+
+    def search(self, params):
+        self.calls.append(("search", params))
+        if self.fail_search(params):
+            raise RuntimeError("search failed")
+        return {
+            "results": [
+                {"title": f"{params['query']} result", "url": "https://example.com/a"}
+            ]
+        }
+
+    def extract(self, urls):
+        self.calls.append(("extract", list(urls)))
+        if self.fail_extract(urls):
+            raise RuntimeError("extract failed")
+        return {
+            "results": [
+                {
+                    "url": url,
+                    "title": "Page",
+                    "raw_content": self.contents.get(url, f"content of {url}"),
+                }
+                for url in urls
+            ]
+        }
+
+
+@pytest.fixture
+def tavily(monkeypatch, tmp_path):
+    """Install the fake tavily module and an isolated search cache."""
+    fake = FakeTavily()
+    monkeypatch.setitem(sys.modules, "tavily", fake.module)
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setenv("TAVILY_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("TAVILY_HTTP2", raising=False)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def search_news():
+    """The web-search-news script as a module."""
+    return load_script("web-search-news/scripts/search_news.py")
+
+
+@pytest.fixture(scope="session")
+def search_all():
+    """The web-search-all script as a module."""
+    return load_script("web-search-all/scripts/search_all.py")
+
+
+@pytest.fixture(scope="session")
+def extract_detail():
+    """The web-search-docs extract script as a module."""
+    return load_script("web-search-docs/scripts/extract_detail.py")
@@ -5,19 +5,32 @@ Tests cover:
 - Timeout handling for long-running commands
 - Output truncation for large outputs
 - Working directory correctness
+- Direct argv execution vs. shell fallback
 - Combined stdout/stderr output
 - Stable ID property
 - Container availability checks
+- Concurrent batch execution
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from libs.backends import DockerExecutionBackend
 
+# Prefix the backend adds to every exec for its default_timeout of 5 seconds
+TIMEOUT_PREFIX = ["timeout", "-k", "5", "5"]
+
+
+def mock_exec_result(mock_client, output, exit_code=0):
+    """Configure the mocked low-level exec API to return the given result."""
+    mock_client.api.exec_create.return_value = {"Id": "exec-id"}
+    mock_client.api.exec_start.side_effect = lambda *args, **kwargs: iter([output] if output else [])
+    mock_client.api.exec_inspect.return_value = {"ExitCode": exit_code}
+
 
 class TestDockerExecutionBackend:
     """Test suite for DockerExecutionBackend execution capabilities."""
@@ -31,12 +44,11 @@ class TestDockerExecutionBackend:
     @pytest.fixture
     def mock_docker_client(self):
         """Create a mock Docker client."""
-        with patch('agent.backend_docker.docker.from_env') as mock_from_env:
+        with patch('libs.backends.docker.backend.docker.from_env') as mock_from_env:
             # Create mock client and container
             mock_client = Mock()
             mock_container = Mock()
             mock_container.status = "running"
-            mock_container.exec_run = Mock()
             
             mock_client.containers.get = Mock(return_value=mock_container)
             mock_from_env.return_value = mock_client
@@ -55,13 +67,10 @@ class TestDockerExecutionBackend:
 
     def test_successful_command_execution(self, backend, mock_docker_client):
         """Test that successful commands return correct exit code and output."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        # Mock successful exec_run
-        mock_container.exec_run.return_value = MagicMock(
-            output=b"Hello, World!\n",
-            exit_code=0
-        )
+        # Mock successful exec
+        mock_exec_result(mock_client, b"Hello, World!\n", exit_code=0)
         
         result = backend.execute("echo 'Hello, World!'")
         
@@ -71,12 +80,9 @@ class TestDockerExecutionBackend:
 
     def test_command_exit_code(self, backend, mock_docker_client):
         """Test that non-zero exit codes are captured correctly."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        mock_container.exec_run.return_value = MagicMock(
-            output=b"",
-            exit_code=42
-        )
+        mock_exec_result(mock_client, b"", exit_code=42)
         
         result = backend.execute("exit 42")
         
@@ -84,14 +90,11 @@ class TestDockerExecutionBackend:
 
     def test_output_truncation(self, backend, mock_docker_client):
         """Test that large outputs are truncated with middle section removed."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
         # Generate output larger than max_output_chars (1000)
         large_output = b"A" * 2000
-        mock_container.exec_run.return_value = MagicMock(
-            output=large_output,
-            exit_code=0
-        )
+        mock_exec_result(mock_client, large_output, exit_code=0)
         
         result = backend.execute("python3 -c \"print('A' * 2000)\"")
         
@@ -101,14 +104,11 @@ class TestDockerExecutionBackend:
 
     def test_combined_stdout_stderr(self, backend, mock_docker_client):
         """Test that both stdout and stderr are captured in output."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
         # Mock combined output
         combined_output = b"stdout message\nstderr message\n"
-        mock_container.exec_run.return_value = MagicMock(
-            output=combined_output,
-            exit_code=0
-        )
+        mock_exec_result(mock_client, combined_output, exit_code=0)
         
         result = backend.execute("echo 'stdout message' && echo 'stderr message' >&2")
         
@@ -129,7 +129,7 @@ class TestDockerExecutionBackend:
 
     def test_container_not_running(self, temp_workspace):
         """Test error when container exists but is not running."""
-        with patch('agent.backend_docker.docker.from_env') as mock_from_env:
+        with patch('libs.backends.docker.backend.docker.from_env') as mock_from_env:
             mock_client = Mock()
             mock_container = Mock()
             mock_container.status = "exited"  # Not running
@@ -147,7 +147,7 @@ class TestDockerExecutionBackend:
 
     def test_container_not_found(self, temp_workspace):
         """Test error when container doesn't exist."""
-        with patch('agent.backend_docker.docker.from_env') as mock_from_env:
+        with patch('libs.backends.docker.backend.docker.from_env') as mock_from_env:
             from docker.errors import NotFound
             
             mock_client = Mock()
@@ -164,12 +164,9 @@ class TestDockerExecutionBackend:
 
     def test_command_with_pipes(self, backend, mock_docker_client):
         """Test that shell features like pipes work correctly."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        mock_container.exec_run.return_value = MagicMock(
-            output=b"Hello\n",
-            exit_code=0
-        )
+        mock_exec_result(mock_client, b"Hello\n", exit_code=0)
         
         result = backend.execute("echo 'hello' | tr 'h' 'H'")
         
@@ -178,12 +175,9 @@ class TestDockerExecutionBackend:
 
     def test_multiline_output(self, backend, mock_docker_client):
         """Test that multiline output is captured correctly."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        mock_container.exec_run.return_value = MagicMock(
-            output=b"line1\nline2\nline3\n",
-            exit_code=0
-        )
+        mock_exec_result(mock_client, b"line1\nline2\nline3\n", exit_code=0)
         
         result = backend.execute("echo 'line1' && echo 'line2' && echo 'line3'")
         
@@ -194,29 +188,203 @@ class TestDockerExecutionBackend:
 
     def test_working_directory(self, backend, mock_docker_client):
         """Test that commands execute with correct working directory."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        mock_container.exec_run.return_value = MagicMock(
-            output=b"/workspace\n",
-            exit_code=0
-        )
+        mock_exec_result(mock_client, b"/workspace\n", exit_code=0)
         
         result = backend.execute("pwd")
         
-        # Verify exec_run was called with workdir=/workspace
-        mock_container.exec_run.assert_called_once()
-        call_kwargs = mock_container.exec_run.call_args[1]
+        # Verify exec was created with workdir=/workspace
+        mock_client.api.exec_create.assert_called_once()
+        call_kwargs = mock_client.api.exec_create.call_args[1]
         assert call_kwargs['workdir'] == "/workspace"
 
     def test_error_handling(self, backend, mock_docker_client):
         """Test that execution errors are handled gracefully."""
-        _, mock_container = mock_docker_client
+        mock_client, _ = mock_docker_client
         
-        # Mock an exception during exec_run
-        mock_container.exec_run.side_effect = Exception("Container communication error")
+        # Mock an exception during exec creation
+        mock_client.api.exec_create.side_effect = Exception("Container communication error")
         
         result = backend.execute("some command")
         
         assert result.exit_code == 1
         assert "Error executing command" in result.output
         assert result.truncated is False
+
+    def test_environment_built_once(self, backend, mock_docker_client):
+        """Test that the environment dict is built once and reused across calls."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"ok\n", exit_code=0)
+        
+        with patch.dict('os.environ', {"TEST_ENV_VAR": "value"}):
+            backend.execute("echo one")
+            backend.execute("echo two")
+        
+        first_env = mock_client.api.exec_create.call_args_list[0][1]['environment']
+        second_env = mock_client.api.exec_create.call_args_list[1][1]['environment']
+        assert first_env is second_env
+        assert "TEST_ENV_VAR=value" in first_env
+
+    def test_streamed_output_truncation(self, backend, mock_docker_client):
+        """Test that output streamed in many chunks is truncated to head and tail."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        chunks = [b"H" * 100] * 6 + [b"M" * 100] * 50 + [b"T" * 100] * 6
+        mock_client.api.exec_start.side_effect = lambda *args, **kwargs: iter(chunks)
+        
+        result = backend.execute("generate-output")
+        
+        assert result.truncated is True
+        assert result.output.startswith("H" * 500)
+        assert result.output.endswith("T" * 500)
+        assert "M" not in result.output
+
+    def test_streamed_output_within_limit(self, backend, mock_docker_client):
+        """Test that chunked output under the limit is returned unmodified."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        chunks = [b"a" * 300, b"b" * 300, b"c" * 399, b"d"]
+        mock_client.api.exec_start.side_effect = lambda *args, **kwargs: iter(chunks)
+        
+        result = backend.execute("generate-output")
+        
+        assert result.truncated is False
+        assert result.output == "a" * 300 + "b" * 300 + "c" * 399 + "d"
+
+    def test_truncation_preserves_head_and_tail(self, backend, mock_docker_client):
+        """Test that truncation keeps the beginning and end of the output."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"H" * 600 + b"M" * 2000 + b"T" * 600, exit_code=0)
+        
+        result = backend.execute("generate-output")
+        
+        assert result.truncated is True
+        assert result.output.startswith("H" * 500)
+        assert result.output.endswith("T" * 500)
+        assert "M" not in result.output
+
+    def test_truncation_keeps_multibyte_characters_whole(self, backend, mock_docker_client):
+        """Test that cuts inside a multi-byte UTF-8 character do not produce U+FFFD."""
+        mock_client, _ = mock_docker_client
+        
+        # Two-byte characters offset by one ASCII byte, so both the head cut
+        # (byte 500) and the tail cut (500 bytes from the end) split one
+        mock_exec_result(mock_client, ("x" + "é" * 1500 + "y").encode(), exit_code=0)
+        
+        result = backend.execute("generate-output")
+        
+        assert result.truncated is True
+        assert "\ufffd" not in result.output
+        head, tail = result.output.split("\n... [truncated] ...\n")
+        assert head == "x" + "é" * 249
+        assert tail == "é" * 249 + "y"
+
+    def test_truncation_odd_limit_keeps_full_tail(self, temp_workspace, mock_docker_client):
+        """Test that an odd output limit gives the extra byte to the tail."""
+        mock_client, _ = mock_docker_client
+        backend = DockerExecutionBackend(
+            root_dir=temp_workspace,
+            container_name="test-container",
+            max_output_chars=1001,
+        )
+        
+        mock_exec_result(mock_client, b"H" * 600 + b"M" * 2000 + b"T" * 600, exit_code=0)
+        
+        result = backend.execute("generate-output")
+        
+        head, tail = result.output.split("\n... [truncated] ...\n")
+        assert head == "H" * 500
+        assert tail == "T" * 501
+
+    def test_execute_many_preserves_order(self, backend, mock_docker_client):
+        """Test that execute_many runs every command and returns results in order."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        mock_client.api.exec_create.side_effect = lambda container, cmd, **kwargs: {"Id": cmd[-1]}
+        mock_client.api.exec_start.side_effect = lambda exec_id, **kwargs: iter([exec_id.encode()])
+        
+        results = asyncio.run(backend.execute_many(["cat news", "cat blogs", "cat docs"]))
+        
+        assert [r.output for r in results] == ["news", "blogs", "docs"]
+        assert all(r.exit_code == 0 for r in results)
+
+    def test_timeout_enforced_in_container(self, backend, mock_docker_client):
+        """Test that commands run under coreutils timeout and report its exit code 124."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=124)
+        
+        results = asyncio.run(backend.execute_many(["sleep 10"]))
+        
+        call_kwargs = mock_client.api.exec_create.call_args[1]
+        assert call_kwargs['cmd'] == [*TIMEOUT_PREFIX, "sh", "-c", "sleep 10"]
+        assert results[0].exit_code == 124
+
+    def test_timeout_override(self, backend, mock_docker_client):
+        """Test that an explicit timeout replaces the default and 0 disables it."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        
+        backend.execute("ls", timeout=30)
+        assert mock_client.api.exec_create.call_args[1]['cmd'] == ["timeout", "-k", "5", "30", "ls"]
+        
+        backend.execute("ls", timeout=0)
+        assert mock_client.api.exec_create.call_args[1]['cmd'] == ["ls"]
+
+    def test_empty_output(self, backend, mock_docker_client):
+        """Test that commands producing no output return an empty string."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        
+        result = backend.execute("true")
+        
+        assert result.output == ""
+        assert result.exit_code == 0
+        assert result.truncated is False
+
+    def test_simple_command_runs_without_shell(self, backend, mock_docker_client):
+        """Test that simple commands are executed directly as an argv list."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"ok\n", exit_code=0)
+        
+        backend.execute("python3 /skills/script.py --query 'two words'")
+        
+        call_kwargs = mock_client.api.exec_create.call_args[1]
+        assert call_kwargs['cmd'] == [
+            *TIMEOUT_PREFIX, "python3", "/skills/script.py", "--query", "two words"
+        ]
+
+    @pytest.mark.parametrize("command", [
+        "echo 'hello' | tr 'h' 'H'",
+        "cd /data && ls",
+        "echo $HOME",
+        "ls *.csv",
+        "cd /data",
+        "FOO=bar env",
+        "echo 'unbalanced",
+        "command -v python3",
+        "type python3",
+        "hash python3",
+        "time python3 x.py",
+        "echo hello",
+        "node script.js",
+    ])
+    def test_shell_command_uses_sh(self, backend, mock_docker_client, command):
+        """Test that shell features, builtins, and non-allowlisted programs use sh -c."""
+        mock_client, _ = mock_docker_client
+        
+        mock_exec_result(mock_client, b"", exit_code=0)
+        
+        backend.execute(command)
+        
+        call_kwargs = mock_client.api.exec_create.call_args[1]
+        assert call_kwargs['cmd'] == [*TIMEOUT_PREFIX, "sh", "-c", command]
@@ -0,0 +1,114 @@
+"""Unit tests for the extract_detail script.
+
+Tests cover:
+- Extract batching (20 URLs per request)
+- Partial and total extract batch failures
+- Repeated URL and duplicate content handling
+- Output filenames
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+
+class TestUrlToFilename:
+    """Test suite for url_to_filename."""
+
+    @pytest.mark.parametrize(
+        ("url", "domain"),
+        [
+            ("https://example.com", "example-com"),
+            ("example.com", "example-com"),
+            ("example.com/docs/page", "example-com"),
+            ("https://docs.example.com/api?version=2", "docs-example-com"),
+        ],
+    )
+    def test_domain_prefix_and_hash(self, extract_detail, url, domain):
+        """Test host-only, bare, and query-string URLs get domain-hash names."""
+        url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+        assert extract_detail.url_to_filename(url) == f"{domain}-{url_hash}.md"
+
+    def test_urls_differing_only_in_query_get_distinct_names(self, extract_detail):
+        """Test that the query string is part of the hashed identity."""
+        first = extract_detail.url_to_filename("https://example.com/page?id=1")
+        second = extract_detail.url_to_filename("https://example.com/page?id=2")
+
+        assert first != second
+        assert first.startswith("example-com-") and second.startswith("example-com-")
+
+
+class TestExtractDetail:
+    """Test suite for extract_detail batching and failure handling."""
+
+    @staticmethod
+    def urls(count: int) -> list[str]:
+        return [f"https://docs.example.com/page-{i}" for i in range(count)]
+
+    def test_urls_split_into_batches(self, tavily, extract_detail, tmp_path, capsys):
+        """More than 20 URLs are extracted in batches of at most 20."""
+        extract_detail.main([*self.urls(45), "--output-dir", str(tmp_path / "out")])
+
+        batches = [urls for kind, urls in tavily.calls if kind == "extract"]
+        assert [len(batch) for batch in batches] == [20, 20, 5]
+        output = json.loads(capsys.readouterr().out)
+        assert output["total_files"] == 45
+        assert len(list((tmp_path / "out").iterdir())) == 45
+        # One client serves every batch and is closed afterwards
+        assert tavily.closed == 1
+
+    def test_one_failed_batch_still_succeeds(
+        self, tavily, extract_detail, tmp_path, capsys
+    ):
+        """A failed batch is reported; the other batches are still saved."""
+        urls = self.urls(25)
+        tavily.fail_extract = lambda batch: urls[0] in batch
+
+        extract_detail.main([*urls, "--output-dir", str(tmp_path / "out")])
+
+        captured = capsys.readouterr()
+        assert "extract failed" in captured.err
+        output = json.loads(captured.out)
+        assert [f["url"] for f in output["files"]] == urls[20:]
+
+    def test_all_batches_failing_exits_1(self, tavily, extract_detail, tmp_path):
+        """Exit code is 1 when no batch could be extracted."""
+        tavily.fail_extract = lambda batch: True
+
+        with pytest.raises(SystemExit) as exc:
+            extract_detail.main([*self.urls(25), "--output-dir", str(tmp_path / "out")])
+        assert exc.value.code == 1
+
+
+    def test_repeated_urls_extracted_once(
+        self, tavily, extract_detail, tmp_path, capsys
+    ):
+        """A URL given twice is sent once and not reported as a duplicate."""
+        url = "https://a.com/x"
+
+        extract_detail.main([url, url, "--output-dir", str(tmp_path / "out")])
+
+        assert tavily.calls == [("extract", [url])]
+        output = json.loads(capsys.readouterr().out)
+        assert [f["url"] for f in output["files"]] == [url]
+        assert output["duplicates"] == {}
+
+    def test_duplicate_content_points_to_kept_file(
+        self, tavily, extract_detail, tmp_path, capsys
+    ):
+        """A page with already-seen content is skipped and mapped to its file."""
+        kept, mirror = "https://a.com/x", "https://b.com/y"
+        tavily.contents = {kept: "same page", mirror: "same page"}
+
+        extract_detail.main([kept, kept, mirror, "--output-dir", str(tmp_path / "out")])
+
+        output = json.loads(capsys.readouterr().out)
+        assert [f["url"] for f in output["files"]] == [kept]
+        kept_file = output["files"][0]["filepath"]
+        assert output["duplicates"] == {
+            mirror: {"kept_url": kept, "filepath": kept_file}
+        }
+        assert Path(kept_file).read_text().endswith("same page")
@@ -0,0 +1,68 @@
+"""Unit tests for the sample data generator.
+
+Tests cover:
+- orders.csv header, row count, and column types
+- Identical CSV formatting with and without pyarrow
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+GENERATOR_PATH = (
+    Path(__file__).resolve().parents[1] / "workspace" / "data" / "generate_sample_data.py"
+)
+
+
+def load_generator():
+    """Import generate_sample_data.py as a module."""
+    spec = importlib.util.spec_from_file_location("generate_sample_data", GENERATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+generator = load_generator()
+
+
+class TestOrdersCsv:
+    """Test suite for orders.csv generation."""
+
+    @pytest.fixture(params=["pyarrow", "pandas"])
+    def writer(self, request, monkeypatch):
+        """Run the generator with each CSV writer."""
+        if request.param == "pyarrow" and generator.pa is None:
+            pytest.skip("pyarrow not installed")
+        if request.param == "pandas":
+            monkeypatch.setattr(generator, "pa", None)
+        return request.param
+
+    def test_header_rows_and_dtypes(self, writer, tmp_path):
+        """Test that the CSV has the expected header, row count, and column types."""
+        csv_path = tmp_path / "orders.csv"
+        # More than one batch, so batches are appended under a single header
+        num_rows = generator.BATCH_SIZE + 5
+
+        generator.generate_orders_csv(csv_path, num_rows)
+
+        lines = csv_path.read_text().splitlines()
+        assert lines[0] == "order_id,customer,amount,date,status"
+        assert len(lines) == num_rows + 1
+
+        df = pd.read_csv(csv_path)
+        assert pd.api.types.is_float_dtype(df["amount"])
+        for column in ("order_id", "customer", "date", "status"):
+            assert pd.api.types.is_string_dtype(df[column])
+        assert df["order_id"].iloc[-1] == f"ORD-{num_rows:06d}"
+        assert set(df["status"]) <= set(generator.STATUSES)
+
+    def test_amounts_have_two_decimals(self, writer, tmp_path):
+        """Test that amounts are written the same way regardless of writer."""
+        csv_path = tmp_path / "orders.csv"
+
+        generator.generate_orders_csv(csv_path, 500)
+
+        amounts = pd.read_csv(csv_path, dtype=str)["amount"]
+        assert amounts.str.fullmatch(r"\d+\.\d{2}").all()
@@ -0,0 +1,32 @@
+"""Unit tests for the concurrent search_all sweep.
+
+Tests cover:
+- Failed searches reported under errors
+- Closing the async client
+"""
+
+import json
+
+
+class TestSearchAll:
+    """Test suite for the concurrent search_all sweep."""
+
+    def test_failed_search_reported_under_errors(
+        self, tavily, search_all, tmp_path, capsys
+    ):
+        """One failed search is listed under errors; the others are saved."""
+        tavily.fail_search = lambda params: "engineering blog" in params["query"]
+        output_dir = tmp_path / "out"
+
+        search_all.main(["Acme", "--output-dir", str(output_dir)])
+
+        summary = json.loads(capsys.readouterr().out)
+        assert set(summary["errors"]) == {"blogs"}
+        assert [s["search_type"] for s in summary["searches"]] == ["news", "documentation"]
+        assert sorted(p.name for p in output_dir.iterdir()) == ["docs.json", "news.json"]
+
+    def test_client_closed(self, tavily, search_all, tmp_path, capsys):
+        """The async client is closed once the searches finish."""
+        search_all.main(["Acme", "--output-dir", str(tmp_path / "out")])
+
+        assert tavily.closed == 1
@@ -0,0 +1,47 @@
+"""Unit tests for --append-jsonl in the web-search scripts.
+
+Tests cover:
+- One JSON line per run
+- No line recorded when the --output write fails
+"""
+
+import json
+
+import pytest
+
+
+class TestAppendJsonl:
+    """Test suite for accumulating search results into a JSONL file."""
+
+    def test_each_run_appends_one_json_line(
+        self, tavily, search_news, tmp_path, capsys
+    ):
+        """Two runs append two lines, each a complete search output."""
+        jsonl = tmp_path / "sweep" / "results.jsonl"
+
+        search_news.main(["Acme", "--append-jsonl", str(jsonl)])
+        capsys.readouterr()
+        search_news.main(["Globex", "--append-jsonl", str(jsonl)])
+        summary = json.loads(capsys.readouterr().out)
+
+        records = [json.loads(line) for line in jsonl.read_text().splitlines()]
+        assert [r["company"] for r in records] == ["Acme", "Globex"]
+        assert all(r["search_type"] == "news" and r["results"] for r in records)
+        # Without --output the summary points at the JSONL file
+        assert summary["saved_to"] == str(jsonl)
+
+    def test_failed_output_write_appends_nothing(self, tavily, search_news, tmp_path):
+        """A run that fails to write --output leaves the JSONL file untouched."""
+        jsonl = tmp_path / "results.jsonl"
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+
+        with pytest.raises(SystemExit) as exc:
+            search_news.main([
+                "Acme",
+                "--output", str(blocker / "out.json"),
+                "--append-jsonl", str(jsonl),
+            ])
+
+        assert exc.value.code == 1
+        assert not jsonl.exists()
@@ -0,0 +1,36 @@
+"""Unit tests for the web-search result cache.
+
+Tests cover:
+- Cache hits skipping the Tavily client
+- Original query time on cached output
+- --no-cache
+"""
+
+import json
+
+
+class TestSearchCache:
+    """Test suite for the search result cache."""
+
+    def test_cache_hit_skips_client(self, tavily, search_news, capsys):
+        """A repeated search is served from the cache with its original time."""
+        search_news.main(["Acme"])
+        first = json.loads(capsys.readouterr().out)
+        search_news.main(["Acme"])
+        second = json.loads(capsys.readouterr().out)
+
+        assert len(tavily.calls) == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["queried_at"] == first["queried_at"]
+        assert second["results"] == first["results"]
+
+    def test_no_cache_bypasses_cache(self, tavily, search_news, capsys):
+        """--no-cache queries Tavily even when a cached response exists."""
+        search_news.main(["Acme"])
+        capsys.readouterr()
+        search_news.main(["Acme", "--no-cache"])
+        output = json.loads(capsys.readouterr().out)
+
+        assert len(tavily.calls) == 2
+        assert output["cached"] is False
@@ -6,11 +6,12 @@ Tests cover:
 - Invalid skill handling (missing fields, bad YAML)
 - Prompt injection without full content
 - State management
+- Discovery caching
 """
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -270,3 +271,69 @@ description: Description for skill {i}
         
         assert prompt == ""
 
+
+    def test_skills_prompt_formatted_once_at_init(self, temp_skills_dir, valid_skill):
+        """Test that the skills prompt is built at init and reused across model calls."""
+        middleware = SkillsMiddleware(skills_dir=temp_skills_dir)
+        
+        assert "test-skill" in middleware.skills_prompt
+        
+        request = Mock()
+        request.system_prompt = None
+        handler = Mock(return_value="response")
+        
+        with patch.object(middleware, "_format_skills_prompt") as mock_format:
+            middleware.wrap_model_call(request, handler)
+            middleware.wrap_model_call(request, handler)
+        
+        mock_format.assert_not_called()
+        assert request.override.call_args[1]["system_prompt"] == middleware.skills_prompt
+
+    def test_discovery_cached_until_skills_change(self, temp_skills_dir, valid_skill):
+        """Test that discovery is reused while unchanged and rescanned after a skill is added."""
+        first = SkillsMiddleware(skills_dir=temp_skills_dir)
+        
+        with patch.object(SkillsMiddleware, "_parse_skill_frontmatter") as mock_parse:
+            second = SkillsMiddleware(skills_dir=temp_skills_dir)
+        
+        mock_parse.assert_not_called()
+        assert second.skills == first.skills
+        
+        other_dir = temp_skills_dir / "other-skill"
+        other_dir.mkdir()
+        (other_dir / "SKILL.md").write_text("""---
+name: other-skill
+description: Another skill
+---
+""")
+        
+        third = SkillsMiddleware(skills_dir=temp_skills_dir)
+        assert {skill["name"] for skill in third.skills} == {"test-skill", "other-skill"}
+
+    def test_discovery_sees_skill_md_written_after_mkdir(self, temp_skills_dir, valid_skill):
+        """Test that a SKILL.md added to an already-existing directory is discovered."""
+        other_dir = temp_skills_dir / "other-skill"
+        other_dir.mkdir()
+        assert [s["name"] for s in SkillsMiddleware(skills_dir=temp_skills_dir).skills] == ["test-skill"]
+        
+        (other_dir / "SKILL.md").write_text("""---
+name: other-skill
+description: Another skill
+---
+""")
+        
+        names = {s["name"] for s in SkillsMiddleware(skills_dir=temp_skills_dir).skills}
+        assert names == {"test-skill", "other-skill"}
+
+    def test_discovery_sees_edited_frontmatter(self, temp_skills_dir, valid_skill):
+        """Test that editing an existing SKILL.md's frontmatter is picked up."""
+        SkillsMiddleware(skills_dir=temp_skills_dir)
+        
+        (valid_skill / "SKILL.md").write_text("""---
+name: test-skill
+description: Updated description after the first scan
+---
+""")
+        
+        skills = SkillsMiddleware(skills_dir=temp_skills_dir).skills
+        assert skills[0]["description"] == "Updated description after the first scan"
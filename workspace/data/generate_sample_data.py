@@ -4,27 +4,30 @@
 Creates:
 1. orders.csv - Large CSV with 10,000+ order records
 2. sample_form.pdf - PDF with fillable form fields
+3. sample_form.fields.json - The PDF's form field values, for checks that
+   shouldn't need to re-parse the PDF
 """
 
-import random
-from datetime import datetime, timedelta
+import json
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from pypdf import PdfWriter
 
+# pyarrow is optional: faster CSV writer, falls back to pandas
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
 
-def generate_orders_csv(output_path: Path, num_rows: int = 10000):
-    """Generate a sample orders CSV file.
-
-    Args:
-        output_path: Path to save CSV file.
-        num_rows: Number of order rows to generate.
-    """
-    print(f"Generating {num_rows} order records...")
 
-    # Customer names pool
-    first_names = [
+# Customer names pool
+FIRST_NAMES = np.array(
+    [
         "James",
         "Mary",
         "John",
@@ -46,7 +49,9 @@ def generate_orders_csv(output_path: Path, num_rows: int = 10000):
         "Charles",
         "Karen",
     ]
-    last_names = [
+)
+LAST_NAMES = np.array(
+    [
         "Smith",
         "Johnson",
         "Williams",
@@ -58,50 +63,132 @@ def generate_orders_csv(output_path: Path, num_rows: int = 10000):
         "Rodriguez",
         "Martinez",
     ]
+)
+STATUSES = ["pending", "shipped", "delivered", "cancelled"]
+
+# Rows generated and written at a time; caps memory regardless of num_rows
+BATCH_SIZE = 10_000
+
+
+def write_csv(batches: Iterable[pd.DataFrame], output_path: Path):
+    """Stream DataFrame batches into one CSV file (header once, no index).
+
+    Uses pyarrow's C writer when available. Only one batch is held in
+    memory at a time.
+
+    Args:
+        batches: DataFrames with identical columns, written in order.
+        output_path: Path to save CSV file.
+    """
+    writer = None
+    with open(output_path, "wb") as f:
+        for i, df in enumerate(batches):
+            if i == 0:
+                f.write((",".join(df.columns) + "\n").encode("utf-8"))
+
+            if pa is None:
+                df.to_csv(f, index=False, header=False)
+                continue
+
+            # Unquoted values like df.to_csv (no field contains a comma)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pacsv.CSVWriter(
+                    f,
+                    table.schema,
+                    write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"),
+                )
+            writer.write_table(table)
+
+        if writer is not None:
+            writer.close()
+
 
-    # Generate data
-    data = []
-    start_date = datetime(2023, 1, 1)
-
-    for i in range(num_rows):
-        order_id = f"ORD-{i+1:06d}"
-        customer = f"{random.choice(first_names)} {random.choice(last_names)}"
-
-        # Amount with some high values for filtering demo
-        if random.random() < 0.05:  # 5% high-value orders
-            amount = random.uniform(5000, 50000)
-        else:
-            amount = random.uniform(10, 2000)
-
-        # Random date within 2023-2024
-        days_offset = random.randint(0, 700)
-        order_date = start_date + timedelta(days=days_offset)
-
-        status = random.choice(["pending", "shipped", "delivered", "cancelled"])
-
-        data.append(
-            {
-                "order_id": order_id,
-                "customer": customer,
-                "amount": round(amount, 2),
-                "date": order_date.strftime("%Y-%m-%d"),
-                "status": status,
-            }
-        )
-
-    # Create DataFrame and save
-    df = pd.DataFrame(data)
-    df.to_csv(output_path, index=False)
-    print(f"✓ Created {output_path} with {len(df)} rows")
+def generate_orders_batch(rng: np.random.Generator, start: int, size: int) -> pd.DataFrame:
+    """Generate one batch of order records.
+
+    Args:
+        rng: Random generator shared across batches.
+        start: Number of rows generated before this batch (order ids continue from it).
+        size: Number of rows in this batch.
+
+    Returns:
+        DataFrame with order_id, customer, amount, date, and status columns.
+    """
+    # Each column is a NumPy array (no per-row Python loop)
+    # astype(str) rather than a fixed "U6" so ids past 999999 aren't truncated
+    order_ids = np.char.add(
+        "ORD-", np.char.zfill(np.arange(start + 1, start + size + 1).astype(str), 6)
+    )
+
+    first = FIRST_NAMES[rng.integers(0, len(FIRST_NAMES), size)]
+    last = LAST_NAMES[rng.integers(0, len(LAST_NAMES), size)]
+    customers = np.char.add(np.char.add(first, " "), last)
+
+    # Amount with some high values for filtering demo (5% high-value orders)
+    high_value = rng.random(size) < 0.05
+    amounts = np.where(
+        high_value,
+        rng.uniform(5000, 50000, size),
+        rng.uniform(10, 2000, size),
+    ).round(2)
+
+    # Random date within 2023-2024
+    days_offset = rng.integers(0, 701, size).astype("timedelta64[D]")
+    order_dates = (np.datetime64("2023-01-01") + days_offset).astype(str)
+
+    statuses = rng.choice(STATUSES, size)
+
+    return pd.DataFrame(
+        {
+            "order_id": order_ids,
+            "customer": customers,
+            "amount": amounts,
+            "date": order_dates,
+            "status": statuses,
+        }
+    )
+
+
+def generate_orders_csv(output_path: Path, num_rows: int = 10000):
+    """Generate a sample orders CSV file.
+
+    Args:
+        output_path: Path to save CSV file.
+        num_rows: Number of order rows to generate.
+    """
+    print(f"Generating {num_rows} order records...")
+
+    rng = np.random.default_rng()
+    amount_min, amount_max, high_value_count = np.inf, -np.inf, 0
+
+    def batches():
+        # Track stats as batches stream past, since no full DataFrame exists
+        nonlocal amount_min, amount_max, high_value_count
+        for start in range(0, num_rows, BATCH_SIZE):
+            df = generate_orders_batch(rng, start, min(BATCH_SIZE, num_rows - start))
+            amount_min = min(amount_min, df["amount"].min())
+            amount_max = max(amount_max, df["amount"].max())
+            high_value_count += int((df["amount"] > 5000).sum())
+            # Fixed two-decimal amounts, so the file is identical whichever
+            # CSV writer runs (pyarrow writes 1014.0 as "1014", pandas "1014.0")
+            df["amount"] = np.char.mod("%.2f", df["amount"].to_numpy())
+            yield df
+
+    write_csv(batches(), output_path)
+    print(f"✓ Created {output_path} with {num_rows} rows")
 
     # Print some stats
-    print(f"  - Amount range: ${df['amount'].min():.2f} - ${df['amount'].max():.2f}")
-    print(f"  - High-value orders (>$5000): {len(df[df['amount'] > 5000])}")
+    print(f"  - Amount range: ${amount_min:.2f} - ${amount_max:.2f}")
+    print(f"  - High-value orders (>$5000): {high_value_count}")
 
 
 def generate_sample_form_pdf(output_path: Path):
     """Generate a simple PDF with form fields using reportlab.
 
+    Also writes the field values to a sidecar JSON next to the PDF
+    (sample_form.pdf -> sample_form.fields.json).
+
     Args:
         output_path: Path to save PDF file.
     """
@@ -119,77 +206,32 @@ def generate_sample_form_pdf(output_path: Path):
         c.setFont("Helvetica-Bold", 16)
         c.drawString(50, 750, "Sample Contact Information Form")
 
-        # Add form fields
+        # Add form fields: (name, tooltip, label y-position, prefilled value)
+        fields = [
+            ("Name", "Full Name", 700, "John Doe"),
+            ("Email", "Email Address", 650, "john.doe@example.com"),
+            ("Address", "Street Address", 600, "123 Main Street, Anytown, ST 12345"),
+            ("Phone", "Phone Number", 550, "(555) 123-4567"),
+            ("Company", "Company Name", 500, "Acme Corporation"),
+        ]
         c.setFont("Helvetica", 12)
-
-        # Name field
-        c.drawString(50, 700, "Name:")
-        form = c.acroForm
-        form.textfield(
-            name="Name",
-            tooltip="Full Name",
-            x=150,
-            y=695,
-            width=300,
-            height=20,
-            borderWidth=1,
-            value="John Doe",
-        )
-
-        # Email field
-        c.drawString(50, 650, "Email:")
-        form.textfield(
-            name="Email",
-            tooltip="Email Address",
-            x=150,
-            y=645,
-            width=300,
-            height=20,
-            borderWidth=1,
-            value="john.doe@example.com",
-        )
-
-        # Address field
-        c.drawString(50, 600, "Address:")
-        form.textfield(
-            name="Address",
-            tooltip="Street Address",
-            x=150,
-            y=595,
-            width=300,
-            height=20,
-            borderWidth=1,
-            value="123 Main Street, Anytown, ST 12345",
-        )
-
-        # Phone field
-        c.drawString(50, 550, "Phone:")
-        form.textfield(
-            name="Phone",
-            tooltip="Phone Number",
-            x=150,
-            y=545,
-            width=300,
-            height=20,
-            borderWidth=1,
-            value="(555) 123-4567",
-        )
-
-        # Company field
-        c.drawString(50, 500, "Company:")
-        form.textfield(
-            name="Company",
-            tooltip="Company Name",
-            x=150,
-            y=495,
-            width=300,
-            height=20,
-            borderWidth=1,
-            value="Acme Corporation",
-        )
+        textfield = c.acroForm.textfield
+        for name, tooltip, y, value in fields:
+            c.drawString(50, y, f"{name}:")
+            textfield(
+                name=name,
+                tooltip=tooltip,
+                x=150,
+                y=y - 5,
+                width=300,
+                height=20,
+                borderWidth=1,
+                value=value,
+            )
 
         c.save()
-        print(f"✓ Created {output_path} with 5 form fields")
+        field_values = {name: value for name, _, _, value in fields}
+        print(f"✓ Created {output_path} with {len(fields)} form fields")
 
     except ImportError:
         print("Warning: reportlab not installed, creating simple PDF without forms")
@@ -200,8 +242,13 @@ def generate_sample_form_pdf(output_path: Path):
         with open(output_path, "wb") as output_file:
             pdf_writer.write(output_file)
 
+        field_values = {}
         print(f"✓ Created {output_path} (basic PDF without forms)")
 
+    fields_path = output_path.with_suffix(".fields.json")
+    fields_path.write_text(json.dumps(field_values, indent=2) + "\n")
+    print(f"✓ Created {fields_path}")
+
 
 def main():
     """Generate all sample data files."""
@@ -209,13 +256,17 @@ def main():
     data_dir = Path(__file__).parent
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate CSV
     csv_path = data_dir / "orders.csv"
-    generate_orders_csv(csv_path, num_rows=10000)
-
-    # Generate PDF
     pdf_path = data_dir / "sample_form.pdf"
-    generate_sample_form_pdf(pdf_path)
+
+    # CSV and PDF generation are independent CPU-bound jobs: run them in parallel
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(generate_orders_csv, csv_path, 10000),
+            executor.submit(generate_sample_form_pdf, pdf_path),
+        ]
+        for future in futures:
+            future.result()
 
     print("\n✓ All sample data files generated successfully!")
 